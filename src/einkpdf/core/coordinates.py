@@ -6,24 +6,28 @@ template YAML format (top-left origin) and ReportLab PDF (bottom-left origin).
 Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from ..core.schema import Position
 
 
 class CoordinateConverter:
     """Converts coordinates between top-left (YAML) and bottom-left (PDF) systems."""
     
-    def __init__(self, page_height: float):
+    def __init__(self, page_height: float, page_width: Optional[float] = None):
         """
         Initialize coordinate converter.
         
         Args:
             page_height: Page height in points (e.g., 841.8 for A4)
+            page_width: Page width in points, or None if unknown
         """
         if page_height <= 0:
             raise ValueError(f"Page height must be positive, got {page_height}")
+        if page_width is not None and page_width <= 0:
+            raise ValueError(f"Page width must be positive, got {page_width}")
         
         self.page_height = page_height
+        self.page_width = page_width
     
     def top_left_to_bottom_left(self, x: float, y: float) -> Tuple[float, float]:
         """
@@ -156,7 +160,12 @@ def create_converter_for_canvas(canvas_dimensions: Dict[str, Any]) -> Coordinate
     if not isinstance(height, (int, float)) or height <= 0:
         raise ValueError(f"Canvas height must be positive number, got {height}")
     
-    return CoordinateConverter(height)
+    # Width is optional here; renderers that need it check for None
+    width = canvas_dimensions.get("width")
+    if not isinstance(width, (int, float)) or width <= 0:
+        width = None
+    
+    return CoordinateConverter(height, width)
 
 
 def batch_convert_positions(positions: List[Position], page_height: float) -> List[Dict[str, float]]:
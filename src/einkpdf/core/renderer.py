@@ -31,6 +31,7 @@ from ..validation.yaml_validator import ValidationError
 from .postprocess import add_navigation_to_pdf
 from .tokens import TokenProcessor, RenderingTokenContext
 from .renderers.text import TextEngine, TextRenderingOptions
+from .renderers.base import RenderingError as WidgetRenderingError
 from .renderers import WidgetRendererRegistry, ShapeRenderer, FormRenderer, ImageRenderer, TextRenderer, TableRenderer, LinkRenderer, CompositeRenderer, CalendarRenderer, DayListRenderer
 
 
@@ -317,7 +318,8 @@ class DeterministicPDFRenderer:
             widgets: Widgets to render on this page
             page_num: Current page number
         """
-        # Render master widgets first (if any assigned to this page)
+        # Find master widgets (if any assigned to this page)
+        master_widgets: List[Widget] = []
         master_id = self._page_master_map.get(page_num)
         if master_id:
             master = None
@@ -331,18 +333,23 @@ class DeterministicPDFRenderer:
                     getattr(master, 'widgets', []) or [],
                     key=lambda w: getattr(w, 'z_order', None) or 0
                 )
-                for m_widget in master_widgets:
-                    try:
-                        # Render a copy so we can set page number without mutating original
-                        mw = m_widget.model_copy(update={"page": page_num}) if hasattr(m_widget, 'model_copy') else m_widget
-                        self._render_widget(pdf_canvas, mw, page_num)
-                    except RenderingError as e:
-                        raise e
-                    except Exception as e:
-                        if self.strict_mode:
-                            raise RenderingError(f"Failed to render master widget {getattr(m_widget, 'id', '?')}: {e}") from e
-                        else:
-                            print(f"Warning: Skipping master widget {getattr(m_widget, 'id', '?')} due to rendering error: {e}")
+
+        # Decode the page's images concurrently; drawing below stays serial
+        self._prepare_page_images(master_widgets + list(widgets))
+
+        # Render master widgets first
+        for m_widget in master_widgets:
+            try:
+                # Render a copy so we can set page number without mutating original
+                mw = m_widget.model_copy(update={"page": page_num}) if hasattr(m_widget, 'model_copy') else m_widget
+                self._render_widget(pdf_canvas, mw, page_num)
+            except RenderingError as e:
+                raise e
+            except Exception as e:
+                if self.strict_mode:
+                    raise RenderingError(f"Failed to render master widget {getattr(m_widget, 'id', '?')}: {e}") from e
+                else:
+                    print(f"Warning: Skipping master widget {getattr(m_widget, 'id', '?')} due to rendering error: {e}")
 
         # Sort page widgets by z_order (default to 0 if not specified)
         sorted_widgets = sorted(widgets, key=lambda w: getattr(w, 'z_order', None) or 0)
@@ -363,6 +370,24 @@ class DeterministicPDFRenderer:
                     print(f"Warning: Skipping widget {widget.id} due to rendering error: {e}")
                     continue
     
+    def _prepare_page_images(self, widgets: List[Widget]) -> None:
+        """
+        Let the image renderer load a page's images concurrently before drawing.
+
+        Args:
+            widgets: Widgets that will be rendered on the page
+        """
+        if sum(1 for w in widgets if w.type == 'image') < 2:
+            return
+        try:
+            image_renderer = self.renderer_registry.get_renderer('image', self.converter, self.strict_mode)
+            if hasattr(image_renderer, 'prepare_batch'):
+                image_renderer.prepare_batch(widgets)
+        except (WidgetRenderingError, OSError) as e:
+            # Preparation is only a head start; the image is loaded again (and any
+            # failure reported) when it is drawn
+            logger.debug(f"Concurrent image preparation skipped: {e}")
+
     def _render_widget(self, pdf_canvas: canvas.Canvas, widget: Widget, page_num: int) -> None:
         """
         Render a single widget.
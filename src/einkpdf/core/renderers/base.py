@@ -6,10 +6,12 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
+import string
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Callable, FrozenSet, List, Optional, Tuple
 from reportlab.pdfgen import canvas
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color, HexColor
 
 from ..schema import Widget
 from ..coordinates import CoordinateConverter
@@ -159,6 +161,49 @@ class RenderingUtils:
         except Exception as e:
             logger.warning(f"Failed to draw plain background: {e}")
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def hex_color(value: str) -> Color:
+        """Parse a hex colour string once and reuse the reportlab colour object."""
+        return HexColor(value)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile_link_template(template: str,
+                              fields: FrozenSet[str]) -> Optional[Callable[[Dict[str, Any]], str]]:
+        """
+        Pre-parse a link template into literal/field pieces.
+
+        Returns a function of the field values that matches template.format(**values),
+        or None when the template uses anything beyond plain named fields from
+        `fields` (callers then fall back to str.format, which also reports the error).
+        """
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            return None
+
+        pieces: List[Tuple[str, Optional[str], str]] = []
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is not None:
+                if field_name not in fields or conversion or '{' in (format_spec or ''):
+                    return None
+            pieces.append((literal, field_name, format_spec or ''))
+
+        if all(field_name is None for _, field_name, _ in pieces):
+            static = ''.join(literal for literal, _, _ in pieces)
+            return lambda values: static
+
+        def render(values: Dict[str, Any]) -> str:
+            out = []
+            for literal, field_name, format_spec in pieces:
+                out.append(literal)
+                if field_name is not None:
+                    out.append(format(values[field_name], format_spec))
+            return ''.join(out)
+
+        return render
+
     @staticmethod
     def validate_styling_color(color: str, default: str = '#000000') -> str:
         """Validate and normalize color values."""
@@ -9,19 +9,187 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 import logging
 import calendar
 import math
-from datetime import datetime, date, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional, List
 from reportlab.pdfgen import canvas
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color, HexColor
 
 from ..schema import Widget
-from .base import BaseWidgetRenderer, RenderingError
+from .base import BaseWidgetRenderer, RenderingUtils, RenderingError
 from .text import TextEngine, TextRenderingOptions
 from ..tokens import TokenProcessor, RenderingTokenContext
 from ...i18n import get_month_names, get_weekday_names
 
 logger = logging.getLogger(__name__)
 
+# Validation tables for calendar configuration (invariant across renders)
+_CALENDAR_TYPES = frozenset({'monthly', 'weekly', 'custom_range'})
+_LAYOUT_ORIENTATIONS = frozenset({'horizontal', 'vertical'})
+# link_strategy values accepted by validate_calendar_properties
+_VALID_LINK_STRATEGIES = frozenset({'none', 'simple', 'template'})
+_LINK_STRATEGY_MAP = {
+    'none': 'none',
+    'no_links': 'none',
+    'simple': 'simple',
+    'named_destinations': 'template',
+    'sequential_pages': 'template',
+    'template': 'template'
+}
+# Shared colours (parsed once; reportlab colours are not mutated by the canvas)
+_GRID_LINES_COLOR = HexColor('#CCCCCC')
+_OFF_MONTH_COLOR = '#888888'
+# i18n weekday names start on monday or sunday; index by first_day_of_week (0=Mon..6=Sun)
+_WEEKDAY_START_NAMES = ('monday', 'monday', 'monday', 'monday', 'monday', 'monday', 'sunday')
+# HH:MM labels indexed by minutes since midnight; the trailing entry keeps the
+# "24:00" label for grids that end at midnight (time_end_hour=24)
+_HHMM = tuple(f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)) + ("24:00",)
+
+
+def _coerce_float(value: Any, default: float) -> float:
+    """Convert a property value to float, falling back to default when empty or invalid."""
+    if isinstance(value, float):
+        return value
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return default
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+def _coerce_int(value: Any, default: int,
+                minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
+    """Convert a property value to int with optional clamping."""
+    # Values parsed by the UI are usually ints already; bools still go through int()
+    if isinstance(value, int) and not isinstance(value, bool):
+        result = value
+    elif value is None:
+        result = default
+    else:
+        try:
+            result = int(value)
+        except Exception:
+            result = default
+    if minimum is not None:
+        result = max(minimum, result)
+    if maximum is not None:
+        result = min(maximum, result)
+    return result
+
+
+_TIME_CONFIG_KEYS = ('time_start_hour', 'time_end_hour', 'time_slot_minutes', 'time_label_interval')
+
+
+@dataclass(frozen=True)
+class _TimeConfig:
+    """Clamped time-grid settings shared by the weekly layouts."""
+    time_start_hour: int
+    time_end_hour: int
+    slot_minutes: int
+    label_interval: int
+    total_minutes: int
+    slot_count: int
+
+
+@lru_cache(maxsize=128)
+def _parse_time_config(values: Tuple[Any, ...]) -> _TimeConfig:
+    """Build the time-grid settings from raw property values (ordered as _TIME_CONFIG_KEYS)."""
+    raw_start, raw_end, raw_slot, raw_interval = values
+    time_start_hour = _coerce_int(raw_start, 8, 0, 23)
+    time_end_hour = _coerce_int(raw_end, 20, time_start_hour + 1, 24)
+    slot_minutes = _coerce_int(raw_slot, 60, 5, 240)
+    label_interval = _coerce_int(raw_interval, 60, slot_minutes, 720)
+    total_minutes = max(60, (time_end_hour - time_start_hour) * 60)
+    slot_count = max(1, int(math.ceil(total_minutes / slot_minutes)))
+    return _TimeConfig(time_start_hour, time_end_hour, slot_minutes, label_interval,
+                       total_minutes, slot_count)
+
+
+def _time_config(props: Dict[str, Any]) -> _TimeConfig:
+    """Time-grid settings for a widget, memoized on the raw property values."""
+    values = tuple(props.get(key) for key in _TIME_CONFIG_KEYS)
+    try:
+        return _parse_time_config(values)
+    except TypeError:
+        # Unhashable property values (e.g. lists from YAML) bypass the cache
+        return _parse_time_config.__wrapped__(values)
+
+
+@lru_cache(maxsize=64)
+def _weekday_labels(locale: str, style: str, first_day: int) -> Tuple[str, ...]:
+    """Localized weekday labels (always 7) starting at first_day, memoized per locale/style."""
+    safe_style = style if style in {'short', 'narrow', 'full'} else 'short'
+    start = _WEEKDAY_START_NAMES[first_day]
+    try:
+        return tuple(get_weekday_names(locale, safe_style, start=start))
+    except Exception:
+        return tuple(get_weekday_names('en', 'short', start='monday'))
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, returning None when it is not a valid ISO date."""
+    try:
+        return date.fromisoformat(value)
+    except Exception:
+        return None
+
+
+class _StrokeState:
+    """Tracks stroke colour/width set on a canvas so redundant operators are skipped.
+
+    Only valid while nothing else changes the canvas stroke state; TextEngine
+    brackets its drawing in saveState/restoreState so text rendering is safe.
+    """
+
+    __slots__ = ('pdf_canvas', 'color', 'width')
+
+    def __init__(self, pdf_canvas: canvas.Canvas):
+        self.pdf_canvas = pdf_canvas
+        self.color = None
+        self.width = None
+
+    def set(self, color: Optional[Color], width: float) -> None:
+        """Apply stroke colour (None leaves it unchanged) and line width if they differ."""
+        if color is not None and color is not self.color:
+            self.pdf_canvas.setStrokeColor(color)
+            self.color = color
+        if width != self.width:
+            self.pdf_canvas.setLineWidth(width)
+            self.width = width
+
+
+class _GridGeom:
+    """Invariant cell geometry of a calendar grid, cells numbered row-major from the top-left."""
+
+    __slots__ = ('base_x', 'top_y', 'cell_width', 'cell_height', 'columns')
+
+    def __init__(self, base_x: float, top_y: float, cell_width: float, cell_height: float,
+                 columns: int = 7):
+        self.base_x = base_x
+        self.top_y = top_y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.columns = columns
+
+    def cell_origin(self, idx: int) -> Tuple[float, float]:
+        """Bottom-left corner of cell idx."""
+        row, col = divmod(idx, self.columns)
+        return (self.base_x + col * self.cell_width,
+                self.top_y - row * self.cell_height - self.cell_height)
+
+
+_LINK_TEMPLATE_FIELDS = frozenset({'date', 'year', 'month', 'day'})
+
+
+@lru_cache(maxsize=32)
+def _month_names(locale: str, short: bool) -> Tuple[str, ...]:
+    """Localized month names, memoized per locale/format."""
+    return tuple(get_month_names(locale, short=short))
+
 
 class CalendarRenderer(BaseWidgetRenderer):
     """
@@ -36,11 +204,29 @@ class CalendarRenderer(BaseWidgetRenderer):
         """Initialize calendar renderer with centralized TextEngine."""
         super().__init__(converter, strict_mode)
         self.text_engine = TextEngine(converter)
+        # Layout sub-renderers by calendar type; anything else (custom_range) gets the preview
+        self._layout_renderers = {
+            'monthly': self._render_monthly_calendar,
+            'weekly': self._render_weekly_calendar,
+            'weekly_vertical': self._render_weekly_calendar_vertical,
+        }
+        # (monotonic timestamp, date) so multi-widget exports share one "today"
+        self._today_cache: Tuple[float, date] = (0.0, date.min)
 
     @property
     def supported_widget_types(self) -> list[str]:
         return ['calendar']
 
+    def _today(self) -> date:
+        """Return today's date, refreshed at most once per second."""
+        now = time.monotonic()
+        cached_at, cached_date = self._today_cache
+        if cached_at and now - cached_at < 1.0:
+            return cached_date
+        today = date.today()
+        self._today_cache = (now, today)
+        return today
+
     def render(self, pdf_canvas: canvas.Canvas, widget: Widget, **kwargs) -> None:
         """Render calendar widget based on its type and properties."""
         self.validate_widget(widget)
@@ -65,22 +251,22 @@ class CalendarRenderer(BaseWidgetRenderer):
         # Get position and convert coordinates
         cal_pos = self.converter.convert_position_for_drawing(widget.position)
 
+        # Nothing to draw (or link) for a calendar entirely off the page
+        page_width = self.converter.page_width
+        if (cal_pos['x'] + cal_pos['width'] < 0 or cal_pos['y'] + cal_pos['height'] < 0
+                or (page_width is not None and cal_pos['x'] > page_width)
+                or cal_pos['y'] > self.converter.page_height):
+            logger.debug(f"Calendar widget {widget.id} lies outside the page; skipping")
+            return
+
         # Render based on calendar type
         calendar_type = config['calendar_type']
-        if calendar_type == 'monthly':
-            self._render_monthly_calendar(pdf_canvas, widget, config, cal_pos, text_options,
-                                        page_num, total_pages, enforcer, locale)
-        elif calendar_type == 'weekly':
-            if config.get('layout_orientation') == 'vertical':
-                self._render_weekly_calendar_vertical(pdf_canvas, widget, config, cal_pos,
-                                                    text_options, page_num, total_pages, enforcer, locale)
-            else:
-                self._render_weekly_calendar(pdf_canvas, widget, config, cal_pos,
-                                           text_options, page_num, total_pages, enforcer, locale)
-        else:
-            # Simplified preview for custom_range
-            self._render_calendar_preview(pdf_canvas, widget, config, cal_pos,
-                                        text_options, page_num, total_pages, enforcer, locale)
+        if calendar_type == 'weekly' and config.get('layout_orientation') == 'vertical':
+            calendar_type = 'weekly_vertical'
+        # Simplified preview for custom_range
+        render_layout = self._layout_renderers.get(calendar_type, self._render_calendar_preview)
+        render_layout(pdf_canvas, widget, config, props, cal_pos, text_options,
+                      page_num, total_pages, enforcer, locale)
 
     def _parse_calendar_config(self, props: Dict[str, Any], widget_id: str, page_num: int = 1, total_pages: int = 1) -> Dict[str, Any]:
         """Parse and validate calendar configuration properties."""
@@ -90,7 +276,8 @@ class CalendarRenderer(BaseWidgetRenderer):
         calendar_type = props.get('calendar_type')
         if calendar_type is None:
             calendar_type = 'monthly'  # Documented default from WidgetPalette
-        if calendar_type not in ['monthly', 'weekly', 'custom_range']:
+        # Check the type first: unhashable values (e.g. lists) would raise TypeError in the set lookup
+        if not isinstance(calendar_type, str) or calendar_type not in _CALENDAR_TYPES:
             raise RenderingError(
                 f"Calendar widget '{widget_id}': invalid calendar_type '{calendar_type}'. "
                 f"Supported types: monthly, weekly, custom_range"
@@ -115,7 +302,8 @@ class CalendarRenderer(BaseWidgetRenderer):
         config['layout_orientation'] = props.get('layout_orientation', 'horizontal')
 
         # Validate layout orientation
-        if config['layout_orientation'] not in ['horizontal', 'vertical']:
+        if (not isinstance(config['layout_orientation'], str)
+                or config['layout_orientation'] not in _LAYOUT_ORIENTATIONS):
             raise RenderingError(
                 f"Calendar widget '{widget_id}': invalid layout_orientation '{config['layout_orientation']}'. "
                 f"Must be 'horizontal' or 'vertical'"
@@ -155,17 +343,9 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Parse link strategy accommodating UI values
         ui_link_strategy = props.get('link_strategy', 'none')
-        link_strategy_map = {
-            'none': 'none',
-            'no_links': 'none',
-            'simple': 'simple',
-            'named_destinations': 'template',
-            'sequential_pages': 'template',
-            'template': 'template'
-        }
         raw_link_strategy = str(ui_link_strategy).strip().lower()
         config['raw_link_strategy'] = raw_link_strategy
-        normalized_link = link_strategy_map.get(raw_link_strategy)
+        normalized_link = _LINK_STRATEGY_MAP.get(raw_link_strategy)
         if not normalized_link:
             raise RenderingError(
                 f"Calendar widget '{widget_id}': invalid link_strategy '{ui_link_strategy}'. "
@@ -191,7 +371,10 @@ class CalendarRenderer(BaseWidgetRenderer):
         except Exception as e:
             logger.debug(f"Calendar widget '{widget_id}': token processing failed for start_date: {e}")
 
-        # Try to parse the processed date string
+        # Try to parse the processed date string (ISO fast path, then tolerant strptime)
+        parsed = _parse_iso_date(str(processed_date_str))
+        if parsed is not None:
+            return parsed
         try:
             return datetime.strptime(processed_date_str, '%Y-%m-%d').date()
         except Exception:
@@ -207,26 +390,19 @@ class CalendarRenderer(BaseWidgetRenderer):
                         f"Must be YYYY-MM-DD or YYYY-MM format after token processing"
                     )
                 logger.warning(f"Calendar widget '{widget_id}': invalid start_date '{processed_date_str}' (original: '{date_str}'), using today")
-                return datetime.utcnow().date()
+                return self._today()
 
     @staticmethod
-    def _weekday_start_name(first_day: int) -> str:
-        """Map first-day index to weekday name understood by i18n helpers."""
-        if first_day == 6:
-            return 'sunday'
-        return 'monday'
-
-    def _get_weekday_labels(self, locale: str, style: str, first_day: int) -> List[str]:
+    def _get_weekday_labels(locale: str, style: str, first_day: int) -> Tuple[str, ...]:
         """Get localized weekday labels with safe fallbacks."""
-        safe_style = style if style in {'short', 'narrow', 'full'} else 'short'
-        start = self._weekday_start_name(first_day)
-        try:
-            return get_weekday_names(locale, safe_style, start=start)
-        except Exception:
-            return get_weekday_names('en', 'short', start='monday')
+        return _weekday_labels(locale, style, first_day)
 
     def _apply_styling_constraints(self, styling: dict, enforcer=None) -> dict:
         """Apply device profile constraints to styling parameters."""
+        # Nothing to constrain: hand back the original mapping (callers only read it)
+        if 'size' not in styling and 'font_size' not in styling and 'color' not in styling:
+            return styling
+
         constrained_styling = styling.copy()
 
         # Apply font size constraints
@@ -265,7 +441,7 @@ class CalendarRenderer(BaseWidgetRenderer):
         return constrained_styling
 
     def _render_monthly_calendar(self, pdf_canvas: canvas.Canvas, widget: Widget,
-                                config: Dict[str, Any], cal_pos: Dict[str, float],
+                                config: Dict[str, Any], props: Dict[str, Any], cal_pos: Dict[str, float],
                                 text_options, page_num: int, total_pages: int, enforcer=None, locale: str = 'en') -> None:
         """Render monthly calendar layout using TextEngine for all text."""
         start_date = config['start_date']
@@ -278,29 +454,6 @@ class CalendarRenderer(BaseWidgetRenderer):
         link_strategy = config['link_strategy']
         text_align = text_options.text_align
 
-        # Get additional properties
-        props = getattr(widget, 'properties', {}) or {}
-
-        def _get_float(v: Any, default: float) -> float:
-            try:
-                if v is None:
-                    return default
-                if isinstance(v, str) and not v.strip():
-                    return default
-                return float(v)
-            except Exception:
-                return default
-
-        def _get_int(v: Any, default: int) -> int:
-            try:
-                if v is None:
-                    return default
-                if isinstance(v, str) and not v.strip():
-                    return default
-                return int(v)
-            except Exception:
-                return default
-
         # Get month information
         year = start_date.year
         month = start_date.month
@@ -316,7 +469,7 @@ class CalendarRenderer(BaseWidgetRenderer):
         day_label_style = props.get('weekday_label_style', 'short')  # short|narrow|full
         month_name_format = props.get('month_name_format', 'long')   # long|short
         week_numbers = bool(props.get('week_numbers', False))
-        cell_padding = _get_float(props.get('cell_padding', 4.0), 4.0)
+        cell_padding = _coerce_float(props.get('cell_padding', 4.0), 4.0)
 
         # Reserve space for headers
         font_size = text_options.font_size
@@ -327,13 +480,12 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Calculate how many weeks are needed for this month
         first_of_month = date(year, month, 1)
-        first_weekday = first_of_month.weekday()  # 0=Monday, 6=Sunday
+        first_ordinal = first_of_month.toordinal()
 
-        # Adjust first weekday based on first_day_of_week setting
-        if first_day_of_week == 0:  # Monday=0 (Python default)
-            pass  # first_weekday is already correct (0=Monday)
-        else:  # Sunday=0 (US style)
-            first_weekday = (first_weekday + 1) % 7
+        # Monthly grid starts on Monday (0) or Sunday (6, US style) only
+        grid_start_day = 0 if first_day_of_week == 0 else 6
+        # Column of the 1st within the first row
+        first_weekday = (first_of_month.weekday() - grid_start_day) % 7
 
         days_in_month = calendar.monthrange(year, month)[1]
         weeks_needed = math.ceil((days_in_month + first_weekday) / 7)
@@ -367,7 +519,7 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Month and year header (locale aware) using TextEngine
         if show_header:
-            month_names = get_month_names(locale, short=(month_name_format != 'long'))
+            month_names = _month_names(locale, month_name_format != 'long')
 
             # Build header text based on what to show
             header_parts = []
@@ -416,20 +568,14 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Weekday headers using TextEngine
         if show_weekdays:
-            # Convert first_day_of_week to string format expected by get_weekday_names
-            start_day = 'monday' if first_day_of_week == 0 else 'sunday'
-            weekdays = get_weekday_names(locale, style=day_label_style, start=start_day)
+            weekdays = self._get_weekday_labels(locale, day_label_style, grid_start_day)
 
             weekday_y = cal_pos['y'] + calendar_height - header_height - font_size
 
+            # One text box reused for every label; only x changes (render_text does not keep it)
+            weekday_box = {'x': 0.0, 'y': weekday_y, 'width': cell_width, 'height': font_size}
             for i, day_name in enumerate(weekdays):
-                # Create weekday text box
-                weekday_box = {
-                    'x': cal_pos['x'] + week_col_width + (i * cell_width),
-                    'y': weekday_y,
-                    'width': cell_width,
-                    'height': font_size
-                }
+                weekday_box['x'] = cal_pos['x'] + week_col_width + (i * cell_width)
 
                 # Create smaller font options for weekday headers
                 weekday_text_options = TextRenderingOptions(
@@ -443,163 +589,156 @@ class CalendarRenderer(BaseWidgetRenderer):
                 # Render weekday using TextEngine
                 self.text_engine.render_text(pdf_canvas, weekday_box, day_name, weekday_text_options)
 
+        # Highlight target is the same for every cell
+        target_highlight: Optional[date] = None
+        if highlight_date_str:
+            target_highlight = _parse_iso_date(str(highlight_date_str))
+        elif highlight_today:
+            target_highlight = self._today()
+
         # Grid layout starting position
         grid_start_y = cal_pos['y'] + calendar_height - header_height - weekday_height
+        grid_start_x = cal_pos['x'] + week_col_width
+
+        # First date of each calendar row (may fall in the previous month)
+        row_first_dates = [
+            date.fromordinal(first_ordinal + week * 7 - first_weekday)
+            for week in range(actual_weeks)
+        ]
+        week_numbers_list = (
+            [d.isocalendar()[1] for d in row_first_dates] if week_numbers else []
+        )
+
+        # Stroke widths are constant for the grid; resolve them (and enforcer checks) once
+        stroke = _StrokeState(pdf_canvas)
+        grid_stroke_width = 0.5
+        if show_grid_lines and enforcer:
+            grid_stroke_width = enforcer.check_stroke_width(0.5)
+        highlight_stroke_width = 1.0
+        if target_highlight and enforcer:
+            try:
+                highlight_stroke_width = enforcer.check_stroke_width(1.0)
+            except Exception:
+                target_highlight = None  # highlight is best-effort, as before
 
         # Draw calendar grid using optimal number of weeks
-        for week in range(actual_weeks):
-            # Bottom of this row
-            row_bottom_y = grid_start_y - ((week + 1) * cell_height)
-
-            for day_col in range(7):
-                # Calculate cell position (offset by week number column if present)
-                cell_x = cal_pos['x'] + week_col_width + (day_col * cell_width)
-                cell_y = row_bottom_y
-
-                # Calculate day number
-                day_number = (week * 7 + day_col) - first_weekday + 1
-                is_current_month = 1 <= day_number <= days_in_month
-
-                # Determine the actual date for this cell (supports trailing/leading days)
-                current_date = None
-                if is_current_month:
-                    current_date = date(year, month, day_number)
-                elif show_trailing_days:
-                    if day_number < 1:
-                        pm = month - 1 if month > 1 else 12
-                        py = year if month > 1 else year - 1
-                        pdays = calendar.monthrange(py, pm)[1]
-                        current_date = date(py, pm, pdays + day_number)
-                    else:
-                        nm = month + 1 if month < 12 else 1
-                        ny = year if month < 12 else year + 1
-                        current_date = date(ny, nm, day_number - days_in_month)
-
-                # Draw cell border if grid lines enabled
-                if show_grid_lines:
-                    if enforcer:
-                        stroke_width = enforcer.check_stroke_width(0.5)
-                    else:
-                        stroke_width = 0.5
-                    pdf_canvas.setLineWidth(stroke_width)
-                    pdf_canvas.rect(cell_x, cell_y, cell_width, cell_height, stroke=1, fill=0)
-
-                # Draw day label (current month or trailing/leading if enabled)
-                if is_current_month or (show_trailing_days and current_date):
-                    day_text = str((current_date.day if current_date else day_number))
-
-                    # Create day text box with padding
-                    day_box = {
-                        'x': cell_x + cell_padding,
-                        'y': cell_y + cell_height - font_size - cell_padding,
-                        'width': cell_width - 2 * cell_padding,
-                        'height': font_size
-                    }
-
-                    # Create text options for day numbers
-                    day_color = '#888888' if not is_current_month else text_options.color
-                    day_text_options = TextRenderingOptions(
+        # Day-number box geometry relative to the cell (invariant across cells)
+        day_text_y_off = cell_height - font_size - cell_padding
+        day_text_width = cell_width - 2 * cell_padding
+        # Text boxes reused across cells/rows; render_text does not keep a reference
+        day_box = {'x': 0.0, 'y': 0.0, 'width': day_text_width, 'height': font_size}
+        wn_box = {'x': cal_pos['x'], 'y': 0.0, 'width': week_col_width, 'height': font_size * 0.8}
+
+        grid_geom = _GridGeom(grid_start_x, grid_start_y, cell_width, cell_height)
+
+        # Day numbers draw straight onto the canvas; keep their font/fill inside this bracket
+        with self.text_engine.horizontal_batch(pdf_canvas) as day_writer:
+            for week in range(actual_weeks):
+                # Bottom of this row
+                row_bottom_y = grid_start_y - ((week + 1) * cell_height)
+
+                for day_col in range(7):
+                    # Calculate cell position (offset by week number column if present)
+                    cell_x = grid_start_x + (day_col * cell_width)
+                    cell_y = row_bottom_y
+
+                    # Calculate day number
+                    day_number = (week * 7 + day_col) - first_weekday + 1
+                    is_current_month = 1 <= day_number <= days_in_month
+
+                    # Determine the actual date for this cell (supports trailing/leading days)
+                    current_date = None
+                    if is_current_month or show_trailing_days:
+                        current_date = date.fromordinal(first_ordinal + day_number - 1)
+
+                    # Draw cell border if grid lines enabled
+                    if show_grid_lines:
+                        stroke.set(None, grid_stroke_width)
+                        pdf_canvas.rect(cell_x, cell_y, cell_width, cell_height, stroke=1, fill=0)
+
+                    # Draw day label (current month or trailing/leading if enabled)
+                    if is_current_month or (show_trailing_days and current_date):
+                        day_text = str((current_date.day if current_date else day_number))
+
+                        # Position day text box with padding
+                        day_box['x'] = cell_x + cell_padding
+                        day_box['y'] = cell_y + day_text_y_off
+
+                        # Create text options for day numbers
+                        day_color = _OFF_MONTH_COLOR if not is_current_month else text_options.color
+                        day_text_options = TextRenderingOptions(
+                            font_name=text_options.font_name,
+                            font_size=text_options.font_size,
+                            color=day_color,
+                            text_align=text_align,
+                            orientation=text_options.orientation
+                        )
+
+                        # Process tokens in day text (unlikely but possible)
+                        try:
+                            render_context = RenderingTokenContext(page_num=page_num, total_pages=total_pages)
+                            day_text = TokenProcessor.replace_rendering_tokens(day_text, render_context)
+                        except Exception:
+                            pass  # Day numbers rarely contain tokens
+
+                        # Render day using TextEngine
+                        day_writer.draw(day_box, day_text, day_text_options)
+
+                        # Link for current month days (only for dates >= start_date)
+                        logger.debug("Calendar link debug - Link strategy: %s, current_date: %s, start_date: %s",
+                                     link_strategy, current_date, start_date)
+
+                        if link_strategy != 'none' and current_date and is_current_month and current_date >= start_date:
+                            self._create_calendar_date_link(
+                                pdf_canvas, widget, current_date,
+                                grid_geom, week * 7 + day_col,
+                                link_strategy, config.get('raw_link_strategy'), config,
+                                enforcer
+                            )
+
+                        # Highlight today or specific date
+                        try:
+                            if target_highlight and current_date and current_date == target_highlight:
+                                stroke.set(None, highlight_stroke_width)
+                                pdf_canvas.rect(cell_x + 1.5, cell_y + 1.5,
+                                              cell_width - 3, cell_height - 3, stroke=1, fill=0)
+                        except Exception:
+                            pass
+
+                # Week numbers column
+                if week_numbers:
+                    first_date = row_first_dates[week]
+                    week_num = week_numbers_list[week]
+                    wn_text = str(week_num)
+
+                    # Position week number text box
+                    wn_box['y'] = row_bottom_y + (cell_height / 2) - (font_size * 0.4)
+
+                    # Create smaller font options for week numbers
+                    wn_text_options = TextRenderingOptions(
                         font_name=text_options.font_name,
-                        font_size=text_options.font_size,
-                        color=day_color,
+                        font_size=font_size * 0.8,
+                        color=text_options.color,
                         text_align=text_align,
                         orientation=text_options.orientation
                     )
 
-                    # Process tokens in day text (unlikely but possible)
-                    try:
-                        render_context = RenderingTokenContext(page_num=page_num, total_pages=total_pages)
-                        day_text = TokenProcessor.replace_rendering_tokens(day_text, render_context)
-                    except Exception:
-                        pass  # Day numbers rarely contain tokens
-
-                    # Render day using TextEngine
-                    self.text_engine.render_text(pdf_canvas, day_box, day_text, day_text_options)
-
-                    # Link for current month days (only for dates >= start_date)
-                    logger.info(f"Calendar link debug - Link strategy: {link_strategy}, current_date: {current_date}, "f"start_date: {start_date}, ")
-                 
-                    if link_strategy != 'none' and current_date and is_current_month and current_date >= start_date:
-                        self._create_calendar_date_link(
-                            pdf_canvas, widget, current_date,
-                            cell_x, cell_y, cell_width, cell_height,
-                            link_strategy, config.get('raw_link_strategy'), config,
-                            enforcer
-                        )
-
-                    # Highlight today or specific date
-                    try:
-                        target_highlight = None
-                        if highlight_date_str:
-                            target_highlight = datetime.strptime(highlight_date_str, '%Y-%m-%d').date()
-                        elif highlight_today:
-                            target_highlight = datetime.utcnow().date()
-
-                        if target_highlight and current_date and current_date == target_highlight:
-                            if enforcer:
-                                stroke_width = enforcer.check_stroke_width(1.0)
-                            else:
-                                stroke_width = 1.0
-                            pdf_canvas.setLineWidth(stroke_width)
-                            pdf_canvas.rect(cell_x + 1.5, cell_y + 1.5,
-                                          cell_width - 3, cell_height - 3, stroke=1, fill=0)
-                    except Exception:
-                        pass
-
-            # Week numbers column
-            if week_numbers:
-                # Determine first date of this calendar row
-                first_day_num = (week * 7 + 0) - first_weekday + 1
-                if first_day_num < 1:
-                    pm = month - 1 if month > 1 else 12
-                    py = year if month > 1 else year - 1
-                    pdays = calendar.monthrange(py, pm)[1]
-                    first_date = date(py, pm, pdays + first_day_num)
-                elif first_day_num > days_in_month:
-                    nm = month + 1 if month < 12 else 1
-                    ny = year if month < 12 else year + 1
-                    first_date = date(ny, nm, first_day_num - days_in_month)
-                else:
-                    first_date = date(year, month, first_day_num)
-
-                week_num = first_date.isocalendar()[1]
-                wn_text = str(week_num)
-
-                # Create week number text box
-                wn_box = {
-                    'x': cal_pos['x'],
-                    'y': row_bottom_y + (cell_height / 2) - (font_size * 0.4),
-                    'width': week_col_width,
-                    'height': font_size * 0.8
-                }
-
-                # Create smaller font options for week numbers
-                wn_text_options = TextRenderingOptions(
-                    font_name=text_options.font_name,
-                    font_size=font_size * 0.8,
-                    color=text_options.color,
-                    text_align=text_align,
-                    orientation=text_options.orientation
-                )
-
-                # Render week number using TextEngine
-                self.text_engine.render_text(pdf_canvas, wn_box, wn_text, wn_text_options)
+                    # Render week number using TextEngine
+                    self.text_engine.render_text(pdf_canvas, wn_box, wn_text, wn_text_options)
 
-                # Create clickable link for week number if link_strategy is template
-                # Following CLAUDE.md Rule #3: Explicit behavior - only create links when template strategy is used
-                if link_strategy == 'template':
-                    self._create_calendar_week_link(
-                        pdf_canvas, widget, week_num, first_date,
-                        cal_pos['x'], row_bottom_y, week_col_width, cell_height,
-                        config, enforcer
-                    )
+                    # Create clickable link for week number if link_strategy is template
+                    # Following CLAUDE.md Rule #3: Explicit behavior - only create links when template strategy is used
+                    if link_strategy == 'template':
+                        self._create_calendar_week_link(
+                            pdf_canvas, widget, week_num, first_date,
+                            cal_pos['x'], row_bottom_y, week_col_width, cell_height,
+                            config, enforcer
+                        )
 
     def _render_weekly_calendar(self, pdf_canvas: canvas.Canvas, widget: Widget,
-                              config: Dict[str, Any], cal_pos: Dict[str, float],
+                              config: Dict[str, Any], props: Dict[str, Any], cal_pos: Dict[str, float],
                               text_options, page_num: int, total_pages: int, enforcer=None, locale: str = 'en') -> None:
         """Render weekly calendar in horizontal layout using TextEngine."""
-        props = getattr(widget, 'properties', {}) or {}
-
         show_weekdays = config['show_weekdays']
         show_month_name = config['show_month_name']
         show_year = config['show_year']
@@ -612,8 +751,11 @@ class CalendarRenderer(BaseWidgetRenderer):
         start_date = config['start_date']
         first_day_of_week = config['first_day_of_week']
         week_offset = (start_date.weekday() - first_day_of_week) % 7
-        start_of_week = start_date - timedelta(days=week_offset)
-        week_days = [start_of_week + timedelta(days=i) for i in range(7)]
+        week_start_ordinal = start_date.toordinal() - week_offset
+        week_days = [date.fromordinal(week_start_ordinal + i) for i in range(7)]
+        in_month = tuple(d.month == start_date.month for d in week_days)
+        # Horizontal week links every day of start_date's year (month may straddle)
+        link_days = tuple(link_strategy != 'none' and d.year == start_date.year for d in week_days)
 
         # locale passed as parameter from global template metadata
         month_name_format = props.get('month_name_format', 'long')
@@ -625,24 +767,11 @@ class CalendarRenderer(BaseWidgetRenderer):
         show_time_grid = bool(props.get('show_time_grid', False))
         show_time_gutter = bool(props.get('show_time_gutter', False))
 
-        def _coerce_int(value, default, minimum=None, maximum=None):
-            try:
-                result = int(value)
-            except Exception:
-                result = default
-            if minimum is not None:
-                result = max(minimum, result)
-            if maximum is not None:
-                result = min(maximum, result)
-            return result
-
-        time_start_hour = _coerce_int(props.get('time_start_hour'), 8, 0, 23)
-        time_end_hour = _coerce_int(props.get('time_end_hour'), 20, time_start_hour + 1, 24)
-        slot_minutes = _coerce_int(props.get('time_slot_minutes'), 60, 5, 240)
-        label_interval = _coerce_int(props.get('time_label_interval'), 60, slot_minutes, 720)
-
-        total_minutes = max(60, (time_end_hour - time_start_hour) * 60)
-        slot_count = max(1, int(math.ceil(total_minutes / slot_minutes)))
+        time_cfg = _time_config(props)
+        time_start_hour = time_cfg.time_start_hour
+        label_interval = time_cfg.label_interval
+        total_minutes = time_cfg.total_minutes
+        slot_count = time_cfg.slot_count
 
         # Layout dimensions
         calendar_width = cal_pos['width']
@@ -657,6 +786,8 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         grid_width = max(0.0, calendar_width - time_gutter_width)
         cell_width = grid_width / 7 if grid_width > 0 else 0.0
+        # Left edge of each day column, shared by labels, outlines and cells
+        cell_xs = tuple(base_x + time_gutter_width + i * cell_width for i in range(7))
 
         available_height = max(0.0, calendar_height - header_height - weekday_height)
         cell_height = available_height if available_height > 0 else cell_min_size
@@ -665,7 +796,7 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         slot_height = cell_height / slot_count if slot_count else cell_height
 
-        month_names = get_month_names(locale, short=(month_name_format != 'long'))
+        month_names = _month_names(locale, month_name_format != 'long')
         week_number = week_days[0].isocalendar()[1]
 
         # Build header text based on what to show
@@ -699,8 +830,6 @@ class CalendarRenderer(BaseWidgetRenderer):
             grid_top -= header_height
 
         weekday_labels = self._get_weekday_labels(locale, day_label_style, first_day_of_week)
-        if len(weekday_labels) < 7:
-            weekday_labels = (weekday_labels * 7)[:7]
 
         if show_weekdays:
             weekday_options = TextRenderingOptions(
@@ -711,30 +840,23 @@ class CalendarRenderer(BaseWidgetRenderer):
                 orientation=text_options.orientation
             )
             weekday_y = grid_top - font_size
+            box = {'x': 0.0, 'y': weekday_y, 'width': cell_width, 'height': font_size}
             for idx, label in enumerate(weekday_labels):
-                box = {
-                    'x': base_x + time_gutter_width + idx * cell_width,
-                    'y': weekday_y,
-                    'width': cell_width,
-                    'height': font_size
-                }
+                box['x'] = cell_xs[idx]
                 self.text_engine.render_text(pdf_canvas, box, label, weekday_options)
             grid_top -= weekday_height
 
-        grid_lines_color = HexColor('#CCCCCC')
+        grid_lines_color = _GRID_LINES_COLOR
+        stroke = _StrokeState(pdf_canvas)
 
         if show_time_gutter and show_grid_lines and time_gutter_width > 0:
-            pdf_canvas.setStrokeColor(grid_lines_color)
-            pdf_canvas.setLineWidth(0.5)
+            stroke.set(grid_lines_color, 0.5)
             pdf_canvas.line(base_x + time_gutter_width, grid_top, base_x + time_gutter_width,
                             grid_top - cell_height)
 
         label_minutes: List[int] = []
         if show_time_grid:
-            minute = 0
-            while minute <= total_minutes:
-                label_minutes.append(minute)
-                minute += label_interval
+            label_minutes = list(range(0, total_minutes + 1, label_interval))
             if label_minutes[-1] != total_minutes:
                 label_minutes.append(total_minutes)
         elif show_time_gutter:
@@ -750,91 +872,98 @@ class CalendarRenderer(BaseWidgetRenderer):
             )
             gutter_width = max(0.0, time_gutter_width - cell_padding)
             cell_bottom = grid_top - cell_height
+            label_y_offset = label_options.font_size * 0.4
+            label_height = label_options.font_size * 1.2
+            start_base = time_start_hour * 60
+            inv_total = (1.0 / total_minutes) if total_minutes else 0.0
+            label_box = {'x': base_x, 'y': 0.0, 'width': gutter_width, 'height': label_height}
             for minutes_from_start in label_minutes:
-                fraction = minutes_from_start / total_minutes if total_minutes else 0.0
-                label_y = cell_bottom + fraction * cell_height
-                label_box = {
-                    'x': base_x,
-                    'y': label_y - (label_options.font_size * 0.4),
-                    'width': gutter_width,
-                    'height': label_options.font_size * 1.2
-                }
-                absolute_minutes = time_start_hour * 60 + minutes_from_start
-                hour = absolute_minutes // 60
-                minute = absolute_minutes % 60
-                label_text = f"{hour:02d}:{minute:02d}"
+                label_y = cell_bottom + minutes_from_start * inv_total * cell_height
+                label_box['y'] = label_y - label_y_offset
+                label_text = _HHMM[start_base + minutes_from_start]
                 self.text_engine.render_text(pdf_canvas, label_box, label_text, label_options)
 
         target_highlight: Optional[date] = None
         highlight_date_str = props.get('highlight_date')
         if highlight_date_str:
-            try:
-                target_highlight = datetime.strptime(highlight_date_str, '%Y-%m-%d').date()
-            except Exception:
-                target_highlight = None
+            target_highlight = _parse_iso_date(str(highlight_date_str))
         elif bool(props.get('highlight_today', False)):
-            target_highlight = datetime.utcnow().date()
+            target_highlight = self._today()
 
         cell_bottom = grid_top - cell_height
 
-        for idx, day_date in enumerate(week_days):
-            cell_x = base_x + time_gutter_width + idx * cell_width
-            cell_y = cell_bottom
-
-            if show_grid_lines and cell_width > 0 and cell_height > 0:
-                pdf_canvas.setStrokeColor(grid_lines_color)
-                pdf_canvas.setLineWidth(0.5)
-                pdf_canvas.rect(cell_x, cell_y, cell_width, cell_height, stroke=1, fill=0)
-
-            day_color = text_options.color if day_date.month == start_date.month else '#888888'
-            day_text_options = TextRenderingOptions(
-                font_name=text_options.font_name,
-                font_size=text_options.font_size,
-                color=day_color,
-                text_align=text_align,
-                orientation=text_options.orientation
-            )
-            day_box = {
-                'x': cell_x + cell_padding,
-                'y': cell_y + cell_height - font_size - cell_padding,
-                'width': max(0.0, cell_width - 2 * cell_padding),
-                'height': font_size
-            }
-            self.text_engine.render_text(pdf_canvas, day_box, str(day_date.day), day_text_options)
-
-            if show_time_grid and cell_width > 0:
-                pdf_canvas.setStrokeColor(grid_lines_color)
-                pdf_canvas.setLineWidth(0.4)
-                for slot in range(1, slot_count):
-                    line_y = cell_y + slot_height * slot
-                    pdf_canvas.line(cell_x, line_y, cell_x + cell_width, line_y)
-
-            if target_highlight and day_date == target_highlight:
-                pdf_canvas.setStrokeColor(HexColor(day_color if day_color.startswith('#') else '#000000'))
-                pdf_canvas.setLineWidth(1.0)
-                inset = max(1.5, cell_padding)
-                pdf_canvas.rect(cell_x + inset, cell_y + inset,
-                                max(0.0, cell_width - 2 * inset),
-                                max(0.0, cell_height - 2 * inset), stroke=1, fill=0)
+        # Day-number options only differ in colour (in-month vs. off-month)
+        day_opts_in = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=text_options.font_size,
+            color=text_options.color,
+            text_align=text_align,
+            orientation=text_options.orientation
+        )
+        day_opts_out = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=text_options.font_size,
+            color=_OFF_MONTH_COLOR,
+            text_align=text_align,
+            orientation=text_options.orientation
+        )
 
-            # Only create links for dates in the same month/year as start_date
-            if (link_strategy != 'none' and
-                # day_date >= start_date and
-                day_date.year == start_date.year):
-                # day_date.month == start_date.month):
-                self._create_calendar_date_link(
-                    pdf_canvas, widget, day_date,
-                    cell_x, cell_y, cell_width, cell_height,
-                    link_strategy, raw_link_strategy, config,
-                    enforcer
-                )
+        # Day cell outlines: one path for all seven rectangles
+        if show_grid_lines and cell_width > 0 and cell_height > 0:
+            cell_path = pdf_canvas.beginPath()
+            for idx in range(7):
+                cell_path.rect(cell_xs[idx], cell_bottom, cell_width, cell_height)
+            stroke.set(grid_lines_color, 0.5)
+            pdf_canvas.drawPath(cell_path, stroke=1, fill=0)
+
+        # Time-slot rules run across all seven day columns: emit them as one path
+        if show_time_grid and cell_width > 0 and slot_count > 1:
+            grid_left = base_x + time_gutter_width
+            grid_right = grid_left + 7 * cell_width
+            slot_path = pdf_canvas.beginPath()
+            for slot in range(1, slot_count):
+                line_y = cell_bottom + slot_height * slot
+                slot_path.moveTo(grid_left, line_y)
+                slot_path.lineTo(grid_right, line_y)
+            stroke.set(grid_lines_color, 0.4)
+            pdf_canvas.drawPath(slot_path, stroke=1, fill=0)
+
+        day_text_y_off = cell_height - font_size - cell_padding
+        day_text_width = max(0.0, cell_width - 2 * cell_padding)
+        day_box = {'x': 0.0, 'y': cell_bottom + day_text_y_off, 'width': day_text_width, 'height': font_size}
+
+        grid_geom = _GridGeom(base_x + time_gutter_width, grid_top, cell_width, cell_height)
+
+        # Day numbers draw straight onto the canvas; keep their font/fill inside this bracket
+        with self.text_engine.horizontal_batch(pdf_canvas) as day_writer:
+            for idx, day_date in enumerate(week_days):
+                cell_x = cell_xs[idx]
+                cell_y = cell_bottom
+
+                day_text_options = day_opts_in if in_month[idx] else day_opts_out
+                day_color = day_text_options.color
+                day_box['x'] = cell_x + cell_padding
+                day_writer.draw(day_box, str(day_date.day), day_text_options)
+
+                if target_highlight and day_date == target_highlight:
+                    stroke.set(RenderingUtils.hex_color(day_color if day_color.startswith('#') else '#000000'), 1.0)
+                    inset = max(1.5, cell_padding)
+                    pdf_canvas.rect(cell_x + inset, cell_y + inset,
+                                    max(0.0, cell_width - 2 * inset),
+                                    max(0.0, cell_height - 2 * inset), stroke=1, fill=0)
+
+                # Only create links for dates in the same year as start_date
+                if link_days[idx]:
+                    self._create_calendar_date_link(
+                        pdf_canvas, widget, day_date, grid_geom, idx,
+                        link_strategy, raw_link_strategy, config,
+                        enforcer
+                    )
 
     def _render_weekly_calendar_vertical(self, pdf_canvas: canvas.Canvas, widget: Widget,
-                                       config: Dict[str, Any], cal_pos: Dict[str, float],
+                                       config: Dict[str, Any], props: Dict[str, Any], cal_pos: Dict[str, float],
                                        text_options, page_num: int, total_pages: int, enforcer=None, locale: str = 'en') -> None:
         """Render weekly calendar in vertical layout using TextEngine."""
-        props = getattr(widget, 'properties', {}) or {}
-
         show_weekdays = config['show_weekdays']
         show_month_name = config['show_month_name']
         show_year = config['show_year']
@@ -847,8 +976,14 @@ class CalendarRenderer(BaseWidgetRenderer):
         start_date = config['start_date']
         first_day_of_week = config['first_day_of_week']
         week_offset = (start_date.weekday() - first_day_of_week) % 7
-        start_of_week = start_date - timedelta(days=week_offset)
-        week_days = [start_of_week + timedelta(days=i) for i in range(7)]
+        week_start_ordinal = start_date.toordinal() - week_offset
+        week_days = [date.fromordinal(week_start_ordinal + i) for i in range(7)]
+        in_month = tuple(d.month == start_date.month for d in week_days)
+        link_days = tuple(
+            link_strategy != 'none' and d >= start_date
+            and d.year == start_date.year and d.month == start_date.month
+            for d in week_days
+        )
 
         # locale passed as parameter from global template metadata
         month_name_format = props.get('month_name_format', 'long')
@@ -860,24 +995,11 @@ class CalendarRenderer(BaseWidgetRenderer):
         show_time_grid = bool(props.get('show_time_grid', False))
         show_time_gutter = bool(props.get('show_time_gutter', False))
 
-        def _coerce_int(value, default, minimum=None, maximum=None):
-            try:
-                result = int(value)
-            except Exception:
-                result = default
-            if minimum is not None:
-                result = max(minimum, result)
-            if maximum is not None:
-                result = min(maximum, result)
-            return result
-
-        time_start_hour = _coerce_int(props.get('time_start_hour'), 8, 0, 23)
-        time_end_hour = _coerce_int(props.get('time_end_hour'), 20, time_start_hour + 1, 24)
-        slot_minutes = _coerce_int(props.get('time_slot_minutes'), 60, 5, 240)
-        label_interval = _coerce_int(props.get('time_label_interval'), 60, slot_minutes, 720)
-
-        total_minutes = max(60, (time_end_hour - time_start_hour) * 60)
-        slot_count = max(1, int(math.ceil(total_minutes / slot_minutes)))
+        time_cfg = _time_config(props)
+        time_start_hour = time_cfg.time_start_hour
+        label_interval = time_cfg.label_interval
+        total_minutes = time_cfg.total_minutes
+        slot_count = time_cfg.slot_count
 
         calendar_width = cal_pos['width']
         calendar_height = cal_pos['height']
@@ -899,7 +1021,7 @@ class CalendarRenderer(BaseWidgetRenderer):
         cell_width = grid_width if grid_width > 0 else cell_min_size
         slot_width = cell_width / slot_count if slot_count else cell_width
 
-        month_names = get_month_names(locale, short=(month_name_format != 'long'))
+        month_names = _month_names(locale, month_name_format != 'long')
         week_number = week_days[0].isocalendar()[1]
 
         # Build header text based on what to show
@@ -940,103 +1062,89 @@ class CalendarRenderer(BaseWidgetRenderer):
                 text_align=text_align,
                 orientation=text_options.orientation
             )
-            label_minutes = []
-            minute = 0
-            while minute <= total_minutes:
-                label_minutes.append(minute)
-                minute += label_interval
+            label_minutes = list(range(0, total_minutes + 1, label_interval))
             if label_minutes[-1] != total_minutes:
                 label_minutes.append(total_minutes)
 
             time_header_y = grid_top - font_size
+            label_left = base_x + weekday_gutter_width
+            half_slot = slot_width / 2
+            start_base = time_start_hour * 60
+            inv_total = (1.0 / total_minutes) if total_minutes else 0.0
+            label_box = {'x': 0.0, 'y': time_header_y, 'width': slot_width, 'height': font_size}
             for minutes_from_start in label_minutes:
-                fraction = minutes_from_start / total_minutes if total_minutes else 0.0
-                label_x = base_x + weekday_gutter_width + fraction * cell_width
-                label_box = {
-                    'x': label_x - slot_width / 2,
-                    'y': time_header_y,
-                    'width': slot_width,
-                    'height': font_size
-                }
-                absolute_minutes = time_start_hour * 60 + minutes_from_start
-                hour = absolute_minutes // 60
-                minute = absolute_minutes % 60
-                label_text = f"{hour:02d}:{minute:02d}"
+                label_x = label_left + minutes_from_start * inv_total * cell_width
+                label_box['x'] = label_x - half_slot
+                label_text = _HHMM[start_base + minutes_from_start]
                 self.text_engine.render_text(pdf_canvas, label_box, label_text, label_options)
             grid_top -= time_header_height
 
         weekday_labels = self._get_weekday_labels(locale, day_label_style, first_day_of_week)
-        if len(weekday_labels) < 7:
-            weekday_labels = (weekday_labels * 7)[:7]
-        grid_lines_color = HexColor('#CCCCCC')
+        grid_lines_color = _GRID_LINES_COLOR
+        stroke = _StrokeState(pdf_canvas)
 
         target_highlight: Optional[date] = None
         highlight_date_str = props.get('highlight_date')
         if highlight_date_str:
-            try:
-                target_highlight = datetime.strptime(highlight_date_str, '%Y-%m-%d').date()
-            except Exception:
-                target_highlight = None
+            target_highlight = _parse_iso_date(str(highlight_date_str))
         elif bool(props.get('highlight_today', False)):
-            target_highlight = datetime.utcnow().date()
+            target_highlight = self._today()
+
+        # Top edge of each day row
+        row_tops = tuple(grid_top - i * cell_height for i in range(7))
 
+        # Row rules (top edge, each row's bottom edge, weekday gutter divider) as one path
         if show_grid_lines and cell_width > 0 and cell_height > 0:
-            pdf_canvas.setStrokeColor(grid_lines_color)
-            pdf_canvas.setLineWidth(0.5)
+            row_path = pdf_canvas.beginPath()
+            row_path.moveTo(base_x, grid_top)
+            row_path.lineTo(base_x + cell_width + 2*weekday_gutter_width, grid_top)
+            gutter_x = base_x + weekday_gutter_width
+            row_right = gutter_x + cell_width + weekday_gutter_width
+            for idx in range(7):
+                row_bottom = row_tops[idx] - cell_height
+                row_path.moveTo(base_x, row_bottom)
+                row_path.lineTo(row_right, row_bottom)
+                if show_weekdays and weekday_gutter_width > 0:
+                    row_path.moveTo(gutter_x, row_bottom)
+                    row_path.lineTo(gutter_x, row_bottom + cell_height)
+            stroke.set(grid_lines_color, 0.5)
+            pdf_canvas.drawPath(row_path, stroke=1, fill=0)
+
+        weekday_options = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=font_size * 0.8,
+            color=text_options.color,
+            text_align=text_align,
+            orientation=text_options.orientation
+        )
 
-            # pdf_canvas.rect(cell_x, cell_y, cell_width, cell_height, stroke=1, fill=0)
-            pdf_canvas.line(base_x, grid_top, base_x + cell_width + 2*weekday_gutter_width, grid_top)   
+        # Time-slot rules run down all seven day rows: emit them as one path
+        if show_time_grid and cell_height > 0 and slot_count > 1:
+            grid_left = base_x + weekday_gutter_width
+            grid_bottom = grid_top - 7 * cell_height
+            slot_path = pdf_canvas.beginPath()
+            for slot in range(1, slot_count):
+                line_x = grid_left + slot_width * slot
+                slot_path.moveTo(line_x, grid_bottom)
+                slot_path.lineTo(line_x, grid_top)
+            stroke.set(grid_lines_color, 0.4)
+            pdf_canvas.drawPath(slot_path, stroke=1, fill=0)
+
+        label_y_off = cell_height - font_size - cell_padding
+        label_width = weekday_gutter_width - cell_padding
+        cell_x = base_x + weekday_gutter_width
+        label_box = {'x': base_x, 'y': 0.0, 'width': label_width, 'height': font_size}
+        grid_geom = _GridGeom(cell_x, grid_top, cell_width, cell_height, columns=1)
 
         for idx, day_date in enumerate(week_days):
-            row_top = grid_top - idx * cell_height
-            cell_y = row_top - cell_height
-            cell_x = base_x + weekday_gutter_width
+            cell_y = row_tops[idx] - cell_height
 
             if show_weekdays:
-                label_box = {
-                    'x': base_x,
-                    'y': cell_y + cell_height - font_size - cell_padding,
-                    'width': weekday_gutter_width - cell_padding,
-                    'height': font_size
-                }
-                weekday_options = TextRenderingOptions(
-                    font_name=text_options.font_name,
-                    font_size=font_size * 0.8,
-                    color=text_options.color,
-                    text_align=text_align,
-                    orientation=text_options.orientation
-                )
+                label_box['y'] = cell_y + label_y_off
                 weekday_text = f"{weekday_labels[idx]} {day_date.day}"
                 self.text_engine.render_text(pdf_canvas, label_box, weekday_text, weekday_options)
 
-            if show_grid_lines and cell_width > 0 and cell_height > 0:
-                pdf_canvas.setStrokeColor(grid_lines_color)
-                pdf_canvas.setLineWidth(0.5)
-
-                # pdf_canvas.rect(cell_x, cell_y, cell_width, cell_height, stroke=1, fill=0)
-                pdf_canvas.line(base_x, cell_y, cell_x + cell_width + weekday_gutter_width, cell_y)
-                # Draw bottom border for day content area
-                pdf_canvas.line(base_x, cell_y, cell_x + cell_width, cell_y)
-                # Draw right border for weekday gutter (if present)
-                if show_weekdays and weekday_gutter_width > 0:
-                    pdf_canvas.line(base_x + weekday_gutter_width, cell_y,
-                                  base_x + weekday_gutter_width, cell_y + cell_height)
-
-            if show_time_grid and cell_height > 0:
-                pdf_canvas.setStrokeColor(grid_lines_color)
-                pdf_canvas.setLineWidth(0.4)
-                for slot in range(1, slot_count):
-                    line_x = cell_x + slot_width * slot
-                    pdf_canvas.line(line_x, cell_y, line_x, cell_y + cell_height)
-
-            day_color = text_options.color if day_date.month == start_date.month else '#888888'
-            day_text_options = TextRenderingOptions(
-                font_name=text_options.font_name,
-                font_size=text_options.font_size,
-                color=day_color,
-                text_align=text_align,
-                orientation=text_options.orientation
-            )
+            day_color = text_options.color if in_month[idx] else _OFF_MONTH_COLOR
 
             """
             day_box = {
@@ -1049,30 +1157,24 @@ class CalendarRenderer(BaseWidgetRenderer):
             """
 
             if target_highlight and day_date == target_highlight:
-                pdf_canvas.setStrokeColor(HexColor(day_color if day_color.startswith('#') else '#000000'))
-                pdf_canvas.setLineWidth(1.0)
+                stroke.set(RenderingUtils.hex_color(day_color if day_color.startswith('#') else '#000000'), 1.0)
                 inset = max(1.5, cell_padding)
                 pdf_canvas.rect(cell_x + inset, cell_y + inset,
                                 max(0.0, cell_width - 2 * inset),
                                 max(0.0, cell_height - 2 * inset), stroke=1, fill=0)
 
             # Only create links for dates in the same month/year as start_date
-            if (link_strategy != 'none' and
-                day_date >= start_date and
-                day_date.year == start_date.year and
-                day_date.month == start_date.month):
+            if link_days[idx]:
                 self._create_calendar_date_link(
-                    pdf_canvas, widget, day_date,
-                    cell_x, cell_y, cell_width, cell_height,
+                    pdf_canvas, widget, day_date, grid_geom, idx,
                     link_strategy, raw_link_strategy, config,
                     enforcer
                 )
 
     def _render_calendar_preview(self, pdf_canvas: canvas.Canvas, widget: Widget,
-                                config: Dict[str, Any], cal_pos: Dict[str, float],
+                                config: Dict[str, Any], props: Dict[str, Any], cal_pos: Dict[str, float],
                                 text_options, page_num: int, total_pages: int, enforcer=None, locale: str = 'en') -> None:
         """Render simplified calendar preview for custom range calendars."""
-        props = getattr(widget, 'properties', {}) or {}
         start_date = config['start_date']
         end_date_obj: Optional[date] = None
         end_date_str = props.get('end_date')
@@ -1086,7 +1188,7 @@ class CalendarRenderer(BaseWidgetRenderer):
         end_label = end_date_obj.strftime('%Y-%m-%d') if end_date_obj else 'Open'
         summary_text = f"Custom Range: {start_label} – {end_label}"
 
-        pdf_canvas.setStrokeColor(HexColor('#CCCCCC'))
+        pdf_canvas.setStrokeColor(_GRID_LINES_COLOR)
         pdf_canvas.setLineWidth(0.75)
         pdf_canvas.rect(cal_pos['x'], cal_pos['y'], cal_pos['width'], cal_pos['height'], stroke=1, fill=0)
 
@@ -1107,23 +1209,26 @@ class CalendarRenderer(BaseWidgetRenderer):
 
 
     def _create_calendar_date_link(self, pdf_canvas: canvas.Canvas, widget: Widget,
-                                 date_obj: date, cell_x: float, cell_y: float,
-                                 cell_width: float, cell_height: float,
+                                 date_obj: date, geom: _GridGeom, idx: int,
                                  link_strategy: str, raw_link_strategy: Optional[str],
                                  config: Dict[str, Any], enforcer=None, locale: str = 'en') -> None:
         """
         Create PDF link annotation for calendar date cells.
 
+        The cell rectangle is derived from the grid geometry and the cell index.
         Following CLAUDE.md Rule #3: Use parsed config instead of raw props.
         """
+        cell_width = geom.cell_width
+        cell_height = geom.cell_height
+        cell_x, cell_y = geom.cell_origin(idx)
         # Define link rectangle (entire cell is clickable)
         link_rect = (cell_x, cell_y, cell_x + cell_width, cell_y + cell_height)
 
         raw_strategy = (raw_link_strategy or '').lower()
 
         # Comprehensive debugging for link generation
-        logger.info(f"Calendar link debug - Widget: {widget.id}, Date: {date_obj}, "
-                   f"Raw strategy: '{raw_strategy}', Normalized strategy: '{link_strategy}'")
+        logger.debug("Calendar link debug - Widget: %s, Date: %s, Raw strategy: '%s', Normalized strategy: '%s'",
+                     widget.id, date_obj, raw_strategy, link_strategy)
 
         if raw_strategy == 'sequential_pages':
             # Sequential pages strategy needs first_page_number and pages_per_date
@@ -1140,47 +1245,51 @@ class CalendarRenderer(BaseWidgetRenderer):
             destination_page = first_page + day_index * pages_per_date
             destination = f"Page_{destination_page}"
 
-            logger.info(f"Calendar sequential_pages: date={date_obj}, day_index={day_index}, "
-                       f"first_page={first_page}, pages_per_date={pages_per_date}, "
-                       f"→ destination='{destination}'")
+            logger.debug("Calendar sequential_pages: date=%s, day_index=%s, first_page=%s, "
+                         "pages_per_date=%s, → destination='%s'",
+                         date_obj, day_index, first_page, pages_per_date, destination)
 
         elif link_strategy == 'simple':
             # Simple page-based navigation (day number determines page)
             day_number = date_obj.day
             destination = f"Page_{day_number}"
 
-            logger.info(f"Calendar simple: date={date_obj}, day_number={day_number}, "
-                       f"→ destination='{destination}'")
+            logger.debug("Calendar simple: date=%s, day_number=%s, → destination='%s'",
+                         date_obj, day_number, destination)
 
         elif link_strategy == 'template':
             # Template-based destination using date formatting
             # Following CLAUDE.md Rule #3: Use parsed config value
             dest_template = config.get('link_template', 'day:{date}')
             try:
-                destination = dest_template.format(
-                    date=date_obj.isoformat(),
-                    year=date_obj.year,
-                    month=date_obj.month,
-                    day=date_obj.day
-                )
+                link_values = {
+                    'date': date_obj.isoformat(),
+                    'year': date_obj.year,
+                    'month': date_obj.month,
+                    'day': date_obj.day,
+                }
+                render_destination = RenderingUtils.compile_link_template(dest_template, _LINK_TEMPLATE_FIELDS)
+                if render_destination is not None:
+                    destination = render_destination(link_values)
+                else:
+                    destination = dest_template.format(**link_values)
             except (KeyError, ValueError) as e:
                 logger.warning(f"Calendar link template error: {e}")
                 destination = f"day_{date_obj.isoformat()}"
 
-            logger.info(f"Calendar template: date={date_obj}, template='{dest_template}', "
-                       f"→ destination='{destination}'")
+            logger.debug("Calendar template: date=%s, template='%s', → destination='%s'",
+                         date_obj, dest_template, destination)
 
         else:
             # Default: use ISO date format
             destination = f"day_{date_obj.isoformat()}"
 
-            logger.info(f"Calendar default: date={date_obj}, "
-                       f"→ destination='{destination}'")
+            logger.debug("Calendar default: date=%s, → destination='%s'", date_obj, destination)
 
         # Create PDF link annotation
         try:
             pdf_canvas.linkRect("", destination, link_rect, relative=0)
-            logger.debug(f"Created calendar date link to '{destination}' at {link_rect}")
+            logger.debug("Created calendar date link to '%s' at %s", destination, link_rect)
         except Exception as e:
             if self.strict_mode:
                 raise RenderingError(f"Failed to create calendar date link: {e}")
@@ -1277,7 +1386,7 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Validate calendar_type if specified
         calendar_type = props.get('calendar_type')
-        if calendar_type and calendar_type not in ['monthly', 'weekly', 'custom_range']:
+        if calendar_type and (not isinstance(calendar_type, str) or calendar_type not in _CALENDAR_TYPES):
             raise RenderingError(
                 f"Calendar widget '{widget.id}': invalid calendar_type '{calendar_type}'. "
                 f"Must be: monthly, weekly, custom_range"
@@ -1285,7 +1394,7 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Validate layout_orientation if specified
         orientation = props.get('layout_orientation')
-        if orientation and orientation not in ['horizontal', 'vertical']:
+        if orientation and (not isinstance(orientation, str) or orientation not in _LAYOUT_ORIENTATIONS):
             raise RenderingError(
                 f"Calendar widget '{widget.id}': invalid layout_orientation '{orientation}'. "
                 f"Must be: horizontal, vertical"
@@ -1293,7 +1402,7 @@ class CalendarRenderer(BaseWidgetRenderer):
 
         # Validate link_strategy if specified
         link_strategy = props.get('link_strategy')
-        if link_strategy and link_strategy not in ['none', 'simple', 'template']:
+        if link_strategy and (not isinstance(link_strategy, str) or link_strategy not in _VALID_LINK_STRATEGIES):
             raise RenderingError(
                 f"Calendar widget '{widget.id}': invalid link_strategy '{link_strategy}'. "
                 f"Must be: none, simple, template"
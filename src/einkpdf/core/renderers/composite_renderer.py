@@ -7,8 +7,10 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
-import math
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 from reportlab.pdfgen import canvas
 
 from ..schema import Widget, Position
@@ -18,6 +20,113 @@ from ..tokens import TokenProcessor, RenderingTokenContext
 
 logger = logging.getLogger(__name__)
 
+# Lists at least this long compute their grid coordinates with NumPy
+_VECTORIZE_MIN_COUNT = 32
+# Orientations that rotate the list (and are passed on to each generated link)
+_VERTICAL_ORIENTATIONS = ('vertical_cw', 'vertical_ccw')
+_LINK_LIST_ORIENTATIONS = ('horizontal', 'vertical_cw', 'vertical_ccw')
+
+
+class _LinkListConfig(NamedTuple):
+    """Parsed link_list properties."""
+    count: int
+    labels: Optional[List[Any]]
+    destinations: Any
+    start_index: int
+    index_pad: int
+    columns: int
+    gap_x: float
+    gap_y: float
+    item_height: Optional[float]
+    label_template: str
+    bind_expr: str
+    highlight_index: Optional[int]
+    highlight_color: Any
+    orientation: str
+    locale: str
+
+
+class _LinkListLayout(NamedTuple):
+    """Cell grid geometry for a link_list."""
+    base_x: float
+    base_y: float
+    cell_w: float
+    cell_h: float
+    gap_x: float
+    gap_y: float
+    columns: int
+    rows: int
+
+
+class _BlankMissing(dict):
+    """Token values for str.format_map; unknown tokens render as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ''
+
+
+def _normalize_orientation(orientation: Any, widget_id: str) -> str:
+    """Map legacy 'vertical' to 'vertical_cw' and reject unknown orientations."""
+    if orientation == 'vertical':
+        return 'vertical_cw'
+    if orientation not in _LINK_LIST_ORIENTATIONS:
+        raise RenderingError(
+            f"link_list '{widget_id}': invalid orientation '{orientation}', "
+            f"must be 'horizontal', 'vertical_cw', or 'vertical_ccw'"
+        )
+    return orientation
+
+
+def _positive_int(props: Dict[str, Any], key: str, default: int, widget_id: str) -> int:
+    """Read an integer property clamped to >= 1; JSON integers skip the int() conversion."""
+    value = props.get(key, default)
+    if isinstance(value, int):
+        return max(1, int(value))
+    try:
+        return max(1, int(value))
+    except (ValueError, TypeError):
+        raise RenderingError(f"link_list '{widget_id}': invalid {key}, must be positive integer")
+
+
+def _gap_float(props: Dict[str, Any], key: str, widget_id: str) -> float:
+    """Read a gap property as float, treating missing/empty values as 0.0."""
+    value = props.get(key, 0.0) or 0.0
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        raise RenderingError(f"link_list '{widget_id}': invalid gap values, must be numbers")
+
+
+def _grid_coordinates(count: int, columns: int, base_x: float, base_y: float,
+                      step_x: float, step_y: float) -> Tuple[List[float], List[float]]:
+    """Top-left x/y of each link_list cell, filled row by row."""
+    if count >= _VECTORIZE_MIN_COUNT:
+        rows, cols = np.divmod(np.arange(count), columns)
+        return (base_x + cols * step_x).tolist(), (base_y + rows * step_y).tolist()
+    xs = [base_x + (i % columns) * step_x for i in range(count)]
+    ys = [base_y + (i // columns) * step_y for i in range(count)]
+    return xs, ys
+
+
+@lru_cache(maxsize=128)
+def _bind_format_string(template: str) -> str:
+    """
+    Translate a {token} / {token:spec} bind template into a str.format_map template.
+
+    Literal braces outside tokens are escaped so they survive formatting unchanged,
+    matching TokenProcessor._replace_tokens.
+    """
+    parts = []
+    last = 0
+    for match in TokenProcessor.TOKEN_FORMAT_PATTERN.finditer(template):
+        parts.append(template[last:match.start()].replace('{', '{{').replace('}', '}}'))
+        parts.append('{' + match.group(1) + (match.group(2) or '') + '}')
+        last = match.end()
+    parts.append(template[last:].replace('{', '{{').replace('}', '}}'))
+    return ''.join(parts)
+
 
 class CompositeRenderer(BaseWidgetRenderer):
     """
@@ -67,105 +176,77 @@ class CompositeRenderer(BaseWidgetRenderer):
         total_pages = kwargs.get('total_pages', 1)
         links = self._generate_link_widgets(widget, config, layout, styling, page_num, total_pages)
 
-        # Render each generated link using LinkRenderer
+        # Render each generated link using LinkRenderer as it is produced
+        render_link = self.link_renderer.render
         for link_widget in links:
-            self.link_renderer.render(pdf_canvas, link_widget, **kwargs)
+            render_link(pdf_canvas, link_widget, **kwargs)
 
-    def _parse_link_list_config(self, props: Dict[str, Any], widget_id: str) -> Dict[str, Any]:
+    def _parse_link_list_config(self, props: Dict[str, Any], widget_id: str) -> _LinkListConfig:
         """Parse and validate link_list configuration properties."""
-        config = {}
-
         # If labels array is provided, use its length for count
         # This matches UI behavior where labels takes precedence
         labels = props.get('labels')
         if labels and isinstance(labels, list):
-            config['count'] = len(labels)
-            config['labels'] = labels
+            count = len(labels)
         else:
             # Otherwise use count property
-            try:
-                config['count'] = max(1, int(props.get('count', 1)))
-            except (ValueError, TypeError):
-                raise RenderingError(f"link_list '{widget_id}': invalid count, must be positive integer")
-            config['labels'] = None
+            count = _positive_int(props, 'count', 1, widget_id)
+            labels = None
 
-        # Parse start_index with validation
-        try:
-            config['start_index'] = max(1, int(props.get('start_index', 1)))
-        except (ValueError, TypeError):
-            raise RenderingError(f"link_list '{widget_id}': invalid start_index, must be positive integer")
+        # Explicit per-item destinations (optional, may be shorter than count)
+        destinations = props.get('destinations')
 
-        # Parse index_pad with validation
-        try:
-            config['index_pad'] = max(1, int(props.get('index_pad', 3)))
-        except (ValueError, TypeError):
-            raise RenderingError(f"link_list '{widget_id}': invalid index_pad, must be positive integer")
-
-        # Parse columns with validation
-        try:
-            config['columns'] = max(1, int(props.get('columns', 1)))
-        except (ValueError, TypeError):
-            raise RenderingError(f"link_list '{widget_id}': invalid columns, must be positive integer")
+        # Parse index and grid settings with validation
+        start_index = _positive_int(props, 'start_index', 1, widget_id)
+        index_pad = _positive_int(props, 'index_pad', 3, widget_id)
+        columns = _positive_int(props, 'columns', 1, widget_id)
 
         # Parse gaps with validation
-        try:
-            config['gap_x'] = float(props.get('gap_x', 0.0) or 0.0)
-            config['gap_y'] = float(props.get('gap_y', 0.0) or 0.0)
-        except (ValueError, TypeError):
-            raise RenderingError(f"link_list '{widget_id}': invalid gap values, must be numbers")
+        gap_x = _gap_float(props, 'gap_x', widget_id)
+        gap_y = _gap_float(props, 'gap_y', widget_id)
 
         # Parse item_height (optional)
         item_height = props.get('item_height')
         if item_height is not None:
             try:
-                config['item_height'] = float(item_height)
-                if config['item_height'] <= 0:
+                item_height = float(item_height)
+                if item_height <= 0:
                     raise RenderingError(f"link_list '{widget_id}': item_height must be positive")
             except (ValueError, TypeError):
                 raise RenderingError(f"link_list '{widget_id}': invalid item_height, must be positive number")
-        else:
-            config['item_height'] = None
 
         # Parse templates and bindings
-        config['label_template'] = props.get('label_template', 'Note {index_padded}') or 'Note {index_padded}'
-        config['bind_expr'] = props.get('bind', 'notes(@index)') or 'notes(@index)'
+        label_template = props.get('label_template', 'Note {index_padded}') or 'Note {index_padded}'
+        bind_expr = props.get('bind', 'notes(@index)') or 'notes(@index)'
 
         # Parse highlight configuration
         highlight_index = props.get('highlight_index')
         if highlight_index is not None:
             try:
-                config['highlight_index'] = int(highlight_index)
+                highlight_index = int(highlight_index)
             except (ValueError, TypeError):
                 logger.warning(f"link_list '{widget_id}': invalid highlight_index, ignoring")
-                config['highlight_index'] = None
-        else:
-            config['highlight_index'] = None
-
-        config['highlight_color'] = props.get('highlight_color', '#dbeafe')
-
-        # Parse orientation
-        orientation = props.get('orientation', 'horizontal')
-        # Normalize legacy 'vertical' to 'vertical_cw' for backward compatibility
-        if orientation == 'vertical':
-            orientation = 'vertical_cw'
-        if orientation not in ['horizontal', 'vertical_cw', 'vertical_ccw']:
-            raise RenderingError(
-                f"link_list '{widget_id}': invalid orientation '{orientation}', "
-                f"must be 'horizontal', 'vertical_cw', or 'vertical_ccw'"
-            )
-        config['orientation'] = orientation
+                highlight_index = None
+
+        highlight_color = props.get('highlight_color', '#dbeafe')
+
+        # Parse orientation (legacy 'vertical' is normalized to 'vertical_cw')
+        orientation = _normalize_orientation(props.get('orientation', 'horizontal'), widget_id)
 
         # Parse locale for potential future use
-        config['locale'] = str(props.get('locale', 'en')).lower()
+        locale = str(props.get('locale', 'en')).lower()
 
-        return config
+        return _LinkListConfig(
+            count, labels, destinations, start_index, index_pad, columns, gap_x, gap_y,
+            item_height, label_template, bind_expr, highlight_index, highlight_color,
+            orientation, locale
+        )
 
-    def _calculate_link_list_layout(self, widget: Widget, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_link_list_layout(self, widget: Widget, config: _LinkListConfig) -> _LinkListLayout:
         """Calculate layout parameters for link_list items."""
         # For vertical orientations, swap dimensions to match the rotated content space
         # This matches the UI behavior where CanvasWidget swaps dimensions
-        orientation = config.get('orientation', 'horizontal')
-        is_vertical = orientation in ['vertical_cw', 'vertical_ccw']
+        is_vertical = config.orientation in _VERTICAL_ORIENTATIONS
 
         if is_vertical:
             total_w = float(widget.position.height)
@@ -174,14 +255,14 @@ class CompositeRenderer(BaseWidgetRenderer):
             total_w = float(widget.position.width)
             total_h = float(widget.position.height)
 
-        count = config['count']
-        gap_x = config['gap_x']
-        gap_y = config['gap_y']
-        item_height = config['item_height']
-        columns = config['columns']
+        count = config.count
+        gap_x = config.gap_x
+        gap_y = config.gap_y
+        item_height = config.item_height
+        columns = config.columns
 
         # Calculate rows
-        rows = int(math.ceil(count / columns)) if columns > 0 else count
+        rows = (count + columns - 1) // columns if columns > 0 else count
 
         # Base cell sizes from the container
         base_cell_w = (total_w - (columns - 1) * gap_x) / max(1, columns)
@@ -191,151 +272,191 @@ class CompositeRenderer(BaseWidgetRenderer):
         cell_w = base_cell_w
         cell_h = item_height if item_height is not None else base_cell_h
 
-        logger.info(f"[link_list] Layout calc: widget_pos=({widget.position.x},{widget.position.y},{widget.position.width}x{widget.position.height})")
-        logger.info(f"[link_list] count={count}, columns={columns}, rows={rows}, orientation={config.get('orientation')}")
-        logger.info(f"[link_list] total_w={total_w}, total_h={total_h}")
-        logger.info(f"[link_list] cell_w={cell_w}, cell_h={cell_h}, gap_x={gap_x}, gap_y={gap_y}")
-
-        return {
-            'base_x': float(widget.position.x),
-            'base_y': float(widget.position.y),
-            'cell_w': cell_w,
-            'cell_h': cell_h,
-            'gap_x': gap_x,
-            'gap_y': gap_y,
-            'columns': columns,
-            'rows': rows
-        }
-
-    def _generate_link_widgets(self, widget: Widget, config: Dict[str, Any], layout: Dict[str, Any], styling: Dict[str, Any], page_num: int = 1, total_pages: int = 1) -> List[Widget]:
-        """Generate individual internal_link widgets from link_list configuration."""
-        links = []
-
-        count = config['count']
-        start_index = config['start_index']
-        index_pad = config['index_pad']
-        label_template = config['label_template']
-        bind_expr = config['bind_expr']
-        highlight_index = config['highlight_index']
-        highlight_color = config['highlight_color']
-        labels_array = config.get('labels')  # May be None if using template
-
-        base_x = layout['base_x']
-        base_y = layout['base_y']
-        cell_w = layout['cell_w']
-        cell_h = layout['cell_h']
-        gap_x = layout['gap_x']
-        gap_y = layout['gap_y']
-        columns = layout['columns']
-
-        # Also get destinations array if provided
-        props = getattr(widget, 'properties', {}) or {}
-        destinations_array = props.get('destinations')
-
-        for i in range(count):
-            # Calculate position in grid
-            row = i // columns
-            col = i % columns
-
-            # Calculate actual position
-            x = base_x + col * (cell_w + gap_x)
-            y = base_y + row * (cell_h + gap_y)
-
-            logger.info(f"[link_list] Item {i}: row={row}, col={col}, pos=({x},{y}), size=({cell_w}x{cell_h})")
-
-            # Calculate index values
-            actual_index = start_index + i
-            index_padded = str(actual_index).zfill(index_pad)
+        if logger.isEnabledFor(logging.INFO):
+            pos = widget.position
+            logger.info("[link_list] Layout calc: widget_pos=(%s,%s,%sx%s)", pos.x, pos.y, pos.width, pos.height)
+            logger.info("[link_list] count=%s, columns=%s, rows=%s, orientation=%s",
+                        count, columns, rows, config.orientation)
+            logger.info("[link_list] total_w=%s, total_h=%s", total_w, total_h)
+            logger.info("[link_list] cell_w=%s, cell_h=%s, gap_x=%s, gap_y=%s", cell_w, cell_h, gap_x, gap_y)
+
+        return _LinkListLayout(
+            base_x=float(widget.position.x),
+            base_y=float(widget.position.y),
+            cell_w=cell_w,
+            cell_h=cell_h,
+            gap_x=gap_x,
+            gap_y=gap_y,
+            columns=columns,
+            rows=rows
+        )
+
+    def _generate_link_widgets(self, widget: Widget, config: _LinkListConfig, layout: _LinkListLayout, styling: Dict[str, Any], page_num: int = 1, total_pages: int = 1) -> Iterable[Widget]:
+        """
+        Generate individual internal_link widgets from link_list configuration.
 
-            # Generate label - use labels array if available, otherwise use template
-            if labels_array and i < len(labels_array):
-                label = str(labels_array[i])
-                logger.info(f"[link_list] Item {i}: Using label from array: '{label}'")
-            else:
-                # Generate label from template with token processing
-                try:
-                    # First process any tokens in the template
-                    processed_template = label_template
+        Widgets are produced lazily so the caller can render each one as it is built.
+        """
+        count = config.count
+        start_index = config.start_index
+        index_pad = config.index_pad
+        label_template = config.label_template
+        bind_expr = config.bind_expr
+        highlight_index = config.highlight_index
+        highlight_color = config.highlight_color
+        labels_array = config.labels  # May be None if using template
+
+        base_x = layout.base_x
+        base_y = layout.base_y
+        cell_w = layout.cell_w
+        cell_h = layout.cell_h
+        gap_x = layout.gap_x
+        gap_y = layout.gap_y
+        columns = layout.columns
+
+        destinations_array = config.destinations
+
+        # Explicit labels/destinations cover the first N items; the rest use templates
+        label_count = len(labels_array) if labels_array else 0
+        destination_count = len(destinations_array) if destinations_array else 0
+
+        # Render-time tokens in the label template are the same for every item
+        processed_template = label_template
+        try:
+            render_context = RenderingTokenContext(
+                page_num=page_num,
+                total_pages=total_pages
+            )
+            processed_template = TokenProcessor.replace_rendering_tokens(label_template, render_context)
+        except Exception as token_err:
+            logger.warning(f"link_list '{widget.id}': token processing in label_template failed: {token_err}")
+
+        # Normalize the bind expression to {token} placeholders once
+        normalized_bind = bind_expr.replace('{PAGE}', '{page}').replace('{TOTAL_PAGES}', '{total_pages}')
+        normalized_bind = normalized_bind.replace('@index', '{index}').replace('@index_padded', '{index_padded}')
+        bind_format = _bind_format_string(normalized_bind)
+
+        # Item position of the highlighted index; -1 never matches
+        highlight_offset = highlight_index - start_index if highlight_index is not None else -1
+
+        # Zero-padded index formatter with the pad width baked in
+        format_index = f"{{:0{index_pad}d}}".format
+
+        # Per-item logging is skipped entirely unless INFO is enabled
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        # Vertical lists hand their orientation to every generated link
+        orientation = config.orientation
+        link_orientation = orientation if orientation in _VERTICAL_ORIENTATIONS else None
+        if link_orientation and log_info:
+            logger.info("[link_list] Setting orientation=%s on %d items", link_orientation, count)
+
+        # Cell positions for the whole grid in one pass
+        xs, ys = _grid_coordinates(count, columns, base_x, base_y, cell_w + gap_x, cell_h + gap_y)
+
+        # Every generated id, content and property is built here from validated
+        # inputs; only the geometry can break the schema (negative gaps, cells
+        # shrunk to nothing). When it is in range, skip pydantic validation.
+        trusted = (cell_w > 0 and cell_h > 0
+                   and min(xs, default=0.0) >= 0 and min(ys, default=0.0) >= 0)
+        make_position = Position.model_construct if trusted else Position
+        make_widget = Widget.model_construct if trusted else Widget
+
+        def build_links() -> Iterator[Widget]:
+            for i in range(count):
+                x = xs[i]
+                y = ys[i]
+
+                if log_info:
+                    row, col = divmod(i, columns)
+                    logger.info("[link_list] Item %d: row=%d, col=%d, pos=(%s,%s), size=(%sx%s)",
+                                i, row, col, x, y, cell_w, cell_h)
+
+                # Calculate index values
+                actual_index = start_index + i
+                index_padded = format_index(actual_index)
+
+                # Generate label - use labels array if available, otherwise use template
+                if i < label_count:
+                    label = str(labels_array[i])
+                    if log_info:
+                        logger.info("[link_list] Item %d: Using label from array: '%s'", i, label)
+                else:
+                    # Generate label from the token-processed template
                     try:
-                        render_context = RenderingTokenContext(
-                            page_num=page_num,
+                        label = processed_template.format(
+                            index=actual_index,
+                            index_padded=index_padded
+                        )
+                    except (KeyError, ValueError) as e:
+                        logger.warning(f"link_list '{widget.id}': label template error: {e}")
+                        label = f"Item {actual_index}"
+
+                # Generate destination - use destinations array if available, otherwise use bind expression
+                if i < destination_count:
+                    destination = str(destinations_array[i])
+                else:
+                    # Generate destination from bind expression with formatting support
+                    try:
+                        values = _BlankMissing(
+                            index=actual_index,
+                            index_padded=index_padded,
+                            page=page_num,
                             total_pages=total_pages
                         )
-                        processed_template = TokenProcessor.replace_rendering_tokens(label_template, render_context)
-                    except Exception as token_err:
-                        logger.warning(f"link_list '{widget.id}': token processing in label_template failed: {token_err}")
-
-                    # Then format with index values
-                    label = processed_template.format(
-                        index=actual_index,
-                        index_padded=index_padded
-                    )
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"link_list '{widget.id}': label template error: {e}")
-                    label = f"Item {actual_index}"
-
-            # Generate destination - use destinations array if available, otherwise use bind expression
-            if destinations_array and i < len(destinations_array):
-                destination = str(destinations_array[i])
-            else:
-                # Generate destination from bind expression with formatting support
-                try:
-                    normalized_bind = bind_expr.replace('{PAGE}', '{page}').replace('{TOTAL_PAGES}', '{total_pages}')
-                    normalized_bind = normalized_bind.replace('@index', '{index}').replace('@index_padded', '{index_padded}')
-
-                    values = {
-                        'index': actual_index,
-                        'index_padded': index_padded,
-                        'page': page_num,
-                        'total_pages': total_pages
-                    }
-                    destination = TokenProcessor._replace_tokens(normalized_bind, values)
-                except Exception as e:
-                    logger.warning(f"link_list '{widget.id}': bind expression error: {e}")
-                    destination = f"item_{actual_index}"
-
-            # Skip creating link if destination is empty or malformed
-            # Following CLAUDE.md Rule #3: Explicit behavior - empty destinations are skipped
-            # This allows users to create link_list with some empty entries without errors
-            # Also catches malformed destinations like "month:" when navigation variable is empty
-            if not destination or not destination.strip() or destination.endswith(':'):
-                logger.debug(f"link_list '{widget.id}': Skipping item {i} with empty/malformed destination '{destination}'")
-                continue
-
-            # Create position for this link
-            position = Position(
-                x=x,
-                y=y,
-                width=cell_w,
-                height=cell_h
-            )
+                        try:
+                            destination = bind_format.format_map(values)
+                        except (KeyError, IndexError, ValueError, TypeError):
+                            # A bad format spec blanks only its own token in the token processor
+                            destination = TokenProcessor._replace_tokens(normalized_bind, values)
+                    except Exception as e:
+                        logger.warning(f"link_list '{widget.id}': bind expression error: {e}")
+                        destination = f"item_{actual_index}"
+
+                # Skip creating link if destination is empty or malformed
+                # Following CLAUDE.md Rule #3: Explicit behavior - empty destinations are skipped
+                # This allows users to create link_list with some empty entries without errors
+                # Also catches malformed destinations like "month:" when navigation variable is empty
+                if not destination or not destination.strip() or destination.endswith(':'):
+                    logger.debug("link_list '%s': Skipping item %d with empty/malformed destination '%s'",
+                                 widget.id, i, destination)
+                    continue
+
+                # Create position for this link
+                position = make_position(
+                    x=x,
+                    y=y,
+                    width=cell_w,
+                    height=cell_h
+                )
 
-            # Prepare properties for the link
-            link_props = {'to_dest': destination}
-
-            # Pass orientation to generated links
-            if config.get('orientation') in ['vertical_cw', 'vertical_ccw']:
-                link_props['orientation'] = config['orientation']
-                logger.info(f"[link_list] Item {i}: Setting orientation={config['orientation']}")
-
-            # Add highlight if this is the highlighted index
-            if highlight_index is not None and actual_index == highlight_index:
-                link_props['highlight'] = True
-                link_props['highlight_color'] = highlight_color
-
-            # Create the internal_link widget
-            link_widget = Widget(
-                id=f"{widget.id}_item_{actual_index}",
-                type='internal_link',
-                position=position,
-                content=label,
-                properties=link_props,
-                styling=styling
-            )
+                # Prepare properties for the link
+                link_props = {'to_dest': destination}
+
+                # Pass orientation to generated links
+                if link_orientation:
+                    link_props['orientation'] = link_orientation
+
+                # Add highlight if this is the highlighted index
+                if i == highlight_offset:
+                    link_props['highlight'] = True
+                    link_props['highlight_color'] = highlight_color
+
+                # Create the internal_link widget
+                link_widget = make_widget(
+                    id=f"{widget.id}_item_{actual_index}",
+                    type='internal_link',
+                    position=position,
+                    content=label,
+                    properties=link_props,
+                    styling=styling
+                )
 
-            links.append(link_widget)
+                yield link_widget
 
-        return links
+        # Out-of-range geometry raises on construction: build the whole list first
+        # so a failing link_list draws nothing, as before
+        return build_links() if trusted else list(build_links())
 
     def validate_composite_properties(self, widget: Widget) -> None:
         """
@@ -395,16 +516,8 @@ class CompositeRenderer(BaseWidgetRenderer):
                         f"link_list '{widget.id}': item_height must be a positive number, got '{item_height}'"
                     )
 
-            # Validate orientation
-            orientation = props.get('orientation', 'horizontal')
-            # Normalize legacy 'vertical' to 'vertical_cw'
-            if orientation == 'vertical':
-                orientation = 'vertical_cw'
-            if orientation not in ['horizontal', 'vertical_cw', 'vertical_ccw']:
-                raise RenderingError(
-                    f"link_list '{widget.id}': invalid orientation '{orientation}', "
-                    f"must be 'horizontal', 'vertical_cw', or 'vertical_ccw'"
-                )
+            # Validate orientation (same rules as rendering)
+            _normalize_orientation(props.get('orientation', 'horizontal'), widget.id)
 
             # Validate templates are strings
             label_template = props.get('label_template')
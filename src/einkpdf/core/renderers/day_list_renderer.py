@@ -8,18 +8,63 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 import logging
 import calendar
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
 
 from ..schema import Widget
-from .base import BaseWidgetRenderer, RenderingError
+from .base import BaseWidgetRenderer, RenderingUtils, RenderingError
 from .text import TextEngine, TextRenderingOptions
+from .calendar_renderer import _month_names, _weekday_labels
 from ..tokens import TokenProcessor, RenderingTokenContext
-from ...i18n import get_weekday_names
 
 logger = logging.getLogger(__name__)
 
+# Fields available to day and week link templates
+_DAY_LINK_FIELDS = frozenset({'date', 'year', 'month', 'day'})
+_WEEK_LINK_FIELDS = frozenset({'week', 'year', 'month', 'date'})
+
+_NOTES_LINE_COLOR = HexColor('#CCCCCC')
+
+# Accepted option values (tuples so unhashable YAML values still fall back to defaults)
+_WEEKDAY_FORMATS = ('short', 'narrow', 'full')
+_LINK_STRATEGIES = ('no_links', 'named_destinations', 'sequential_pages')
+_ORIENTATIONS = ('horizontal', 'vertical_cw', 'vertical_ccw')
+_MONTH_NAME_FORMATS = ('long', 'short')
+
+# Weekday column width per weekday_format
+_WEEKDAY_WIDTHS = {
+    'full': 80.0,  # Monday, Tuesday, etc.
+    'short': 40.0,  # Mon, Tue, etc.
+    'narrow': 15.0,  # M, T, etc.
+}
+
+
+@lru_cache(maxsize=256)
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month, memoized per (year, month)."""
+    return calendar.monthrange(year, month)[1]
+
+
+@lru_cache(maxsize=256)
+def _month_weeks(year: int, month: int) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Monday-based weekday of the 1st and the ISO week number of every day.
+
+    Memoized per month so planners repeating a month on many pages share it.
+    """
+    first_weekday = date(year, month, 1).weekday()
+    week_numbers = []
+    week_num = 0
+    for day in range(1, _days_in_month(year, month) + 1):
+        # ISO weeks start on Monday, so the week number can only change there;
+        # asking isocalendar() then keeps year boundaries (W52/W53 -> W1) right
+        if day == 1 or (first_weekday + day - 1) % 7 == 0:
+            week_num = date(year, month, day).isocalendar()[1]
+        week_numbers.append(week_num)
+    return first_weekday, tuple(week_numbers)
+
 
 class DayListRenderer(BaseWidgetRenderer):
     """
@@ -90,7 +135,7 @@ class DayListRenderer(BaseWidgetRenderer):
         config['show_weekday_names'] = bool(props.get('show_weekday_names', True))
         config['show_week_numbers'] = bool(props.get('show_week_numbers', False))
         config['weekday_format'] = props.get('weekday_format', 'short')  # short, narrow, full
-        if config['weekday_format'] not in ['short', 'narrow', 'full']:
+        if config['weekday_format'] not in _WEEKDAY_FORMATS:
             config['weekday_format'] = 'short'
 
         # Parse row height
@@ -118,7 +163,7 @@ class DayListRenderer(BaseWidgetRenderer):
 
         # Parse link strategy
         config['link_strategy'] = props.get('link_strategy', 'no_links')
-        if config['link_strategy'] not in ['no_links', 'named_destinations', 'sequential_pages']:
+        if config['link_strategy'] not in _LINK_STRATEGIES:
             config['link_strategy'] = 'no_links'
 
         if config['link_strategy'] == 'sequential_pages':
@@ -131,17 +176,31 @@ class DayListRenderer(BaseWidgetRenderer):
             config['link_template'] = props.get('link_template', 'day:{date}')
             # Following CLAUDE.md Rule #3: Separate templates for different link types
             config['week_link_template'] = props.get('week_link_template', 'week:{week}')
+            # Pre-parsed once per render; None means "use str.format" (also for errors)
+            config['_day_link_fn'] = (
+                RenderingUtils.compile_link_template(config['link_template'], _DAY_LINK_FIELDS)
+                if isinstance(config['link_template'], str) else None
+            )
+            config['_week_link_fn'] = (
+                RenderingUtils.compile_link_template(config['week_link_template'], _WEEK_LINK_FIELDS)
+                if isinstance(config['week_link_template'], str) else None
+            )
+            # Static day templates (no braces at all) are used as-is
+            link_template = config['link_template']
+            config['_link_needs_format'] = (
+                not isinstance(link_template, str) or '{' in link_template or '}' in link_template
+            )
 
         # Parse orientation
         config['orientation'] = props.get('orientation', 'horizontal')
-        if config['orientation'] not in ['horizontal', 'vertical_cw', 'vertical_ccw']:
+        if config['orientation'] not in _ORIENTATIONS:
             config['orientation'] = 'horizontal'
 
         # Parse header options
         config['show_month_header'] = bool(props.get('show_month_header', False))
         config['show_year_in_header'] = bool(props.get('show_year_in_header', False))
         config['month_name_format'] = props.get('month_name_format', 'long')
-        if config['month_name_format'] not in ['long', 'short']:
+        if config['month_name_format'] not in _MONTH_NAME_FORMATS:
             config['month_name_format'] = 'long'
 
         # Use global locale from template metadata (not widget properties)
@@ -151,26 +210,34 @@ class DayListRenderer(BaseWidgetRenderer):
 
     def _parse_start_date(self, date_str: str, widget_id: str, page_num: int, total_pages: int) -> date:
         """Parse date with token processing."""
-        # Process rendering-time tokens
+        # Process rendering-time tokens (plain date strings have nothing to replace;
+        # non-strings still go through the processor, which stringifies them)
         processed_date_str = date_str
-        try:
-            render_context = RenderingTokenContext(page_num=page_num, total_pages=total_pages)
-            processed_date_str = TokenProcessor.replace_rendering_tokens(date_str, render_context)
-        except Exception as e:
-            logger.debug(f"day_list '{widget_id}': token processing failed for start_date: {e}")
+        if not isinstance(date_str, str) or '{' in date_str:
+            try:
+                render_context = RenderingTokenContext(page_num=page_num, total_pages=total_pages)
+                processed_date_str = TokenProcessor.replace_rendering_tokens(date_str, render_context)
+            except Exception as e:
+                logger.debug(f"day_list '{widget_id}': token processing failed for start_date: {e}")
 
-        # Try to parse the date
+        # Try to parse the date with the C-level ISO parsers first
         try:
-            return datetime.strptime(processed_date_str, '%Y-%m-%d').date()
-        except ValueError:
+            return date.fromisoformat(processed_date_str)
+        except (ValueError, TypeError):
             pass
 
-        # Try ISO format
+        # ISO datetime strings (e.g. with a time part)
         try:
             return datetime.fromisoformat(processed_date_str).date()
         except (ValueError, TypeError):
             pass
 
+        # Last resort: strptime also accepts unpadded parts like '2025-1-5'
+        try:
+            return datetime.strptime(processed_date_str, '%Y-%m-%d').date()
+        except (ValueError, TypeError):
+            pass
+
         raise RenderingError(
             f"day_list '{widget_id}': invalid start_date '{date_str}' "
             f"(processed as '{processed_date_str}'). Expected YYYY-MM-DD format."
@@ -206,17 +273,14 @@ class DayListRenderer(BaseWidgetRenderer):
         start_date = config['start_date']
         year = start_date.year
         month = start_date.month
-        days_in_month = calendar.monthrange(year, month)[1]
+        days_in_month = _days_in_month(year, month)
 
         # Get localized weekday names
         locale = config['locale']
         weekday_format = config['weekday_format']
         first_day_of_week = config['first_day_of_week']
 
-        start_day_name = 'monday' if first_day_of_week == 0 else 'sunday'
-        weekday_names = get_weekday_names(locale, style=weekday_format, start=start_day_name)
-        if len(weekday_names) < 7:
-            weekday_names = (weekday_names * 7)[:7]
+        weekday_names = _weekday_labels(locale, weekday_format, first_day_of_week)
 
         # Calculate layout
         row_height = config['row_height']
@@ -241,16 +305,8 @@ class DayListRenderer(BaseWidgetRenderer):
         week_col_width = (text_options.font_size * 1.8) if show_week_numbers else 0.0
 
         day_num_width = 30.0 if show_day_numbers else 0.0
-        if show_weekday_names:
-            # Following CLAUDE.md Rule #3: Explicit behavior - adapt width to format
-            if weekday_format == 'full':
-                weekday_width = 80.0  # Monday, Tuesday, etc.
-            elif weekday_format == 'short':
-                weekday_width = 40.0  # Mon, Tue, etc.
-            else:  # narrow
-                weekday_width = 15.0  # M, T, etc.
-        else:
-            weekday_width = 0.0
+        # Following CLAUDE.md Rule #3: Explicit behavior - adapt width to format
+        weekday_width = _WEEKDAY_WIDTHS[weekday_format] if show_weekday_names else 0.0
         notes_width = widget_width - week_col_width - day_num_width - weekday_width
 
         font_size = text_options.font_size
@@ -264,10 +320,8 @@ class DayListRenderer(BaseWidgetRenderer):
 
         # Render month/year header if enabled
         if show_header:
-            from ...i18n import get_month_names
-
             # Get localized month names
-            month_names = get_month_names(locale, short=(month_name_format == 'short'))
+            month_names = _month_names(locale, month_name_format == 'short')
 
             # Build header text
             header_parts = []
@@ -296,59 +350,121 @@ class DayListRenderer(BaseWidgetRenderer):
         # Calculate available height for day rows
         available_height = widget_height - header_height
 
+        # Per-row text boxes and options are the same for every day except for the
+        # row's y; render_text does not keep a reference to either
+        text_top_offset = 2.0  # Small padding from top edge
+        day_padding = 4.0  # Right padding in points
+        weekday_padding = 4.0  # Left padding in points
+        week_box = {'x': widget_x, 'y': 0.0, 'width': week_col_width, 'height': font_size}
+        day_box = {
+            'x': widget_x + week_col_width,  # Shift right for week column
+            'y': 0.0,
+            'width': day_num_width - day_padding,
+            'height': font_size
+        }
+        weekday_box = {
+            'x': widget_x + week_col_width + day_num_width + weekday_padding,  # Account for week column
+            'y': 0.0,
+            'width': weekday_width - weekday_padding,
+            'height': font_size
+        }
+        week_text_options = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=font_size,
+            color=text_options.color,
+            text_align='center',
+            orientation=text_options.orientation
+        )
+        day_text_options = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=font_size,
+            color=text_options.color,
+            text_align='right',
+            orientation=text_options.orientation
+        )
+        weekday_text_options = TextRenderingOptions(
+            font_name=text_options.font_name,
+            font_size=font_size,
+            color=text_options.color,
+            text_align='left',
+            orientation=text_options.orientation
+        )
+
         # Track previous week number for change detection
         # Following CLAUDE.md Rule #3: Show week numbers only on change (standard planner convention)
         prev_week_num = None
 
+        # Column offsets shared by every row
+        rows_top = widget_y + available_height
+        notes_x = widget_x + week_col_width + day_num_width + weekday_width  # Account for week column
+        notes_right = notes_x + notes_width
+        line_spacing = 3.0  # Fixed spacing between notes lines in points (tight for compact layout)
+        day_link_x = widget_x + week_col_width
+        day_link_width = widget_width - week_col_width
+
+        # Number of rows that fit: estimate by division, then settle with the same
+        # comparison a per-row bounds check would use so boundary rows match exactly
+        max_days = min(days_in_month, max(0, int(available_height // row_height)))
+        while max_days < days_in_month and rows_top - (max_days + 1) * row_height >= widget_y:
+            max_days += 1
+        while max_days > 0 and rows_top - max_days * row_height < widget_y:
+            max_days -= 1
+        if max_days < days_in_month:
+            logger.warning(f"day_list: Day {max_days + 1} exceeds widget height, skipping")
+
+        # Monday-based weekday of the 1st (later days follow by simple offset)
+        # and the ISO week number of each day
+        first_weekday, week_numbers = _month_weeks(year, month)
+
+        # Weekend rows are filled together, underneath everything drawn per row
+        if config['highlight_weekends']:
+            weekend_path = pdf_canvas.beginPath()
+            weekend_rows = 0
+            for day in range(1, max_days + 1):
+                row_y = rows_top - day * row_height
+                # Saturday and Sunday (relative to first_day_of_week, as for the day rows)
+                if (first_weekday + day - 1 - first_day_of_week) % 7 >= 5:
+                    weekend_path.rect(widget_x, row_y, widget_width, row_height)
+                    weekend_rows += 1
+            if weekend_rows:
+                pdf_canvas.saveState()
+                pdf_canvas.setFillColor(RenderingUtils.hex_color(config['weekend_color']))
+                pdf_canvas.drawPath(weekend_path, stroke=0, fill=1)
+                pdf_canvas.restoreState()
+
+        # Notes lines for every row are collected into one path and stroked once
+        draw_notes = show_notes_lines and notes_line_count > 0
+        notes_path = pdf_canvas.beginPath() if draw_notes else None
+        notes_rows = 0
+
         # Render each day
-        for day in range(1, days_in_month + 1):
-            current_date = date(year, month, day)
-            weekday_index = (current_date.weekday() - first_day_of_week) % 7
-            week_num = current_date.isocalendar()[1]  # ISO week number
+        for day in range(1, max_days + 1):
+            # date objects are only built where needed (links)
+            weekday_index = (first_weekday + day - 1 - first_day_of_week) % 7
+            week_num = week_numbers[day - 1]
 
             # Calculate row position (accounting for header)
-            row_index = day - 1
-            row_y = widget_y + available_height - (row_index + 1) * row_height
-
-            # Skip if row would be outside available space
-            if row_y < widget_y:
-                logger.warning(f"day_list: Day {day} exceeds widget height, skipping")
-                break
-
-            # Weekend highlighting
-            is_weekend = weekday_index >= 5  # Saturday and Sunday
-            if config['highlight_weekends'] and is_weekend:
-                pdf_canvas.setFillColor(HexColor(config['weekend_color']))
-                pdf_canvas.rect(widget_x, row_y, widget_width, row_height, fill=1, stroke=0)
+            row_y = rows_top - day * row_height
 
             # Render week number - only when week changes or first day
             # Following CLAUDE.md Rule #3: Show week number only on change (matches calendar behavior)
             # Use full column width for text box to prevent cutoff
+            # Text box y, at the top of the row for minimal gap with lines
+            text_y = row_y + row_height - font_size - text_top_offset
+
             if show_week_numbers:
                 show_this_week = (prev_week_num is None) or (week_num != prev_week_num)
                 if show_this_week:
-                    text_top_offset = 2.0
-                    week_box = {
-                        'x': widget_x,
-                        'y': row_y + row_height - font_size - text_top_offset,
-                        'width': week_col_width,  # Use full width, center alignment handles spacing
-                        'height': font_size
-                    }
+                    # Full column width, center alignment handles spacing
+                    week_box['y'] = text_y
                     week_text = f"W{week_num}"
-                    week_text_options = TextRenderingOptions(
-                        font_name=text_options.font_name,
-                        font_size=font_size,
-                        color=text_options.color,
-                        text_align='center',
-                        orientation=text_options.orientation
-                    )
                     self.text_engine.render_text(pdf_canvas, week_box, week_text, week_text_options)
 
                     # Create clickable link for week number if link_strategy is named_destinations
                     # Following CLAUDE.md Rule #3: Only create links when template strategy is used (matches calendar)
                     if config['link_strategy'] == 'named_destinations':
                         self._create_week_link(
-                            pdf_canvas, config, week_num, current_date,
+                            pdf_canvas, config, week_num, date(year, month, day),
                             widget_x, row_y, week_col_width, row_height
                         )
 
@@ -356,68 +472,43 @@ class DayListRenderer(BaseWidgetRenderer):
 
             # Render day number with padding - positioned at top of row for minimal gap with lines
             if show_day_numbers:
-                day_padding = 4.0  # Right padding in points
-                text_top_offset = 2.0  # Small padding from top edge
-                day_box = {
-                    'x': widget_x + week_col_width,  # Shift right for week column
-                    'y': row_y + row_height - font_size - text_top_offset,
-                    'width': day_num_width - day_padding,
-                    'height': font_size
-                }
-                day_text_options = TextRenderingOptions(
-                    font_name=text_options.font_name,
-                    font_size=font_size,
-                    color=text_options.color,
-                    text_align='right',
-                    orientation=text_options.orientation
-                )
+                day_box['y'] = text_y
                 self.text_engine.render_text(pdf_canvas, day_box, str(day), day_text_options)
 
             # Render weekday name with padding - positioned at top of row for minimal gap with lines
             if show_weekday_names:
-                weekday_padding = 4.0  # Left padding in points
-                text_top_offset = 2.0  # Small padding from top edge
-                weekday_box = {
-                    'x': widget_x + week_col_width + day_num_width + weekday_padding,  # Account for week column
-                    'y': row_y + row_height - font_size - text_top_offset,
-                    'width': weekday_width - weekday_padding,
-                    'height': font_size
-                }
+                weekday_box['y'] = text_y
                 weekday_text = weekday_names[weekday_index]
-                weekday_text_options = TextRenderingOptions(
-                    font_name=text_options.font_name,
-                    font_size=font_size,
-                    color=text_options.color,
-                    text_align='left',
-                    orientation=text_options.orientation
-                )
                 self.text_engine.render_text(pdf_canvas, weekday_box, weekday_text, weekday_text_options)
 
             # Render notes lines at bottom of day cell
             # Following CLAUDE.md Rule #3: Explicit behavior - lines positioned at bottom for writing
             # Note: In PDF coordinates, row_y is the BOTTOM of the row, row_y + row_height is the TOP
-            if show_notes_lines and notes_line_count > 0:
-                notes_x = widget_x + week_col_width + day_num_width + weekday_width  # Account for week column
-                line_spacing = 3.0  # Fixed spacing between lines in points (tight for compact layout)
-
-                pdf_canvas.setStrokeColor(HexColor('#CCCCCC'))
-                pdf_canvas.setLineWidth(0.5)
-
+            if draw_notes:
                 for line_num in range(notes_line_count):
                     # Position lines from bottom up: row_y (bottom) + spacing
                     line_y = row_y + (line_num + 1) * line_spacing
-                    pdf_canvas.line(notes_x, line_y, notes_x + notes_width, line_y)
+                    notes_path.moveTo(notes_x, line_y)
+                    notes_path.lineTo(notes_right, line_y)
+                notes_rows += 1
 
             # Create clickable link for day row (exclude week column to prevent overlap)
             # Following CLAUDE.md Rule #3: Day link starts AFTER week column
             if config['link_strategy'] != 'no_links':
-                day_link_x = widget_x + week_col_width
-                day_link_width = widget_width - week_col_width
                 self._create_day_link(
-                    pdf_canvas, config, current_date, day,
+                    pdf_canvas, config, date(year, month, day), day,
                     day_link_x, row_y, day_link_width, row_height
                 )
 
+        # Rows never overlap each other's notes area, so stroking all lines after the
+        # fills and text looks the same as stroking them row by row
+        if notes_rows:
+            pdf_canvas.saveState()
+            pdf_canvas.setStrokeColor(_NOTES_LINE_COLOR)
+            pdf_canvas.setLineWidth(0.5)
+            pdf_canvas.drawPath(notes_path, stroke=1, fill=0)
+            pdf_canvas.restoreState()
+
         # Validate touch targets if enforcer available
         if enforcer:
             try:
@@ -429,24 +520,35 @@ class DayListRenderer(BaseWidgetRenderer):
     def _create_day_link(self, pdf_canvas: canvas.Canvas, config: Dict[str, Any],
                          current_date: date, day_num: int,
                          row_x: float, row_y: float, row_width: float, row_height: float) -> None:
-        """Create PDF link annotation for a day row."""
+        """Create PDF link annotation for a day row (callers skip 'no_links')."""
         link_strategy = config['link_strategy']
-        destination = None
 
         if link_strategy == 'named_destinations':
             link_template = config.get('link_template', 'day:{date}')
-            try:
-                destination = link_template.format(
-                    date=current_date.isoformat(),
-                    year=current_date.year,
-                    month=current_date.month,
-                    day=day_num
-                )
-            except (KeyError, ValueError) as e:
-                logger.warning(f"day_list link template error: {e}")
-                destination = f"day:{current_date.isoformat()}"
-
-        elif link_strategy == 'sequential_pages':
+            # An empty template can only produce an empty destination
+            if not link_template:
+                return
+
+            if not config.get('_link_needs_format', True):
+                destination = link_template
+            else:
+                values = {
+                    'date': current_date.isoformat(),
+                    'year': current_date.year,
+                    'month': current_date.month,
+                    'day': day_num
+                }
+                render_link = config.get('_day_link_fn')
+                try:
+                    if render_link is not None:
+                        destination = render_link(values)
+                    else:
+                        destination = link_template.format(**values)
+                except (KeyError, ValueError) as e:
+                    logger.warning(f"day_list link template error: {e}")
+                    destination = f"day:{current_date.isoformat()}"
+
+        else:  # sequential_pages
             first_page = config.get('first_page_number', 2)
             destination = f"page_{first_page + day_num - 1}"
 
@@ -488,13 +590,18 @@ class DayListRenderer(BaseWidgetRenderer):
         link_template = config.get('week_link_template', 'week:{week}')
 
         # Format destination using week number and date context
+        values = {
+            'week': week_num,
+            'year': week_date.year,
+            'month': week_date.month,
+            'date': week_date.isoformat()
+        }
+        render_link = config.get('_week_link_fn')
         try:
-            destination = link_template.format(
-                week=week_num,
-                year=week_date.year,
-                month=week_date.month,
-                date=week_date.isoformat()
-            )
+            if render_link is not None:
+                destination = render_link(values)
+            else:
+                destination = link_template.format(**values)
         except (KeyError, ValueError) as e:
             logger.warning(f"Day list week link template error: {e}, using default")
             destination = f"week:{week_num}"
@@ -6,8 +6,9 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from reportlab.pdfgen import canvas
-from reportlab.lib.colors import HexColor
 
 from ..schema import Widget
 from .base import BaseWidgetRenderer, RenderingUtils, RenderingError
@@ -16,6 +17,30 @@ from .text import TextEngine, TextRenderingOptions
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _parse_checkbox_colors(values: Tuple[Any, Any, Any]) -> Tuple[str, str, str, bool]:
+    """Validated (stroke, fill, check) colours plus whether the fill is drawn."""
+    stroke_color, fill_color, check_color = (
+        RenderingUtils.validate_styling_color(value) for value in values
+    )
+    fill_visible = bool(fill_color) and fill_color.lower() not in ('none', 'transparent')
+    return stroke_color, fill_color, check_color, fill_visible
+
+
+def _checkbox_colors(styling: Dict[str, Any]) -> Tuple[str, str, str, bool]:
+    """Checkbox colours for a styling dict, memoized on the raw values."""
+    values = (
+        styling.get('stroke_color', '#000000'),
+        styling.get('fill_color', '#FFFFFF'),
+        styling.get('check_color', '#000000'),
+    )
+    try:
+        return _parse_checkbox_colors(values)
+    except TypeError:
+        # Unhashable styling values bypass the cache
+        return _parse_checkbox_colors.__wrapped__(values)
+
+
 class FormRenderer(BaseWidgetRenderer):
     """
     Renderer for form input widgets.
@@ -53,15 +78,7 @@ class FormRenderer(BaseWidgetRenderer):
         content_text = widget.content
 
         # Get styling
-        stroke_color = RenderingUtils.validate_styling_color(
-            styling.get('stroke_color', '#000000')
-        )
-        fill_color = RenderingUtils.validate_styling_color(
-            styling.get('fill_color', '#FFFFFF')
-        )
-        check_color = RenderingUtils.validate_styling_color(
-            styling.get('check_color', '#000000')
-        )
+        stroke_color, fill_color, check_color, fill_visible = _checkbox_colors(styling)
 
         # Get dimensions
         box_size = RenderingUtils.get_safe_float(props.get('box_size'), 12.0, 4.0, 50.0)
@@ -102,15 +119,13 @@ class FormRenderer(BaseWidgetRenderer):
 
             checkbox_y = widget_box['y'] + (widget_box['height'] - box_size) / 2
 
-            # Draw checkbox background
-            if fill_color and fill_color.lower() not in ['none', 'transparent']:
-                pdf_canvas.setFillColor(HexColor(fill_color))
-                pdf_canvas.rect(checkbox_x, checkbox_y, box_size, box_size, stroke=0, fill=1)
-
-            # Draw checkbox border
-            pdf_canvas.setStrokeColor(HexColor(stroke_color))
+            # Draw checkbox background and border as one fill-and-stroke rect
+            if fill_visible:
+                pdf_canvas.setFillColor(RenderingUtils.hex_color(fill_color))
+            pdf_canvas.setStrokeColor(RenderingUtils.hex_color(stroke_color))
             pdf_canvas.setLineWidth(line_width)
-            pdf_canvas.rect(checkbox_x, checkbox_y, box_size, box_size, stroke=1, fill=0)
+            pdf_canvas.rect(checkbox_x, checkbox_y, box_size, box_size,
+                            stroke=1, fill=1 if fill_visible else 0)
 
             # Draw check mark if checked
             if checked:
@@ -138,25 +153,21 @@ class FormRenderer(BaseWidgetRenderer):
                         size: float, color: str) -> None:
         """Draw a check mark inside the checkbox."""
         try:
-            pdf_canvas.setStrokeColor(HexColor(color))
+            pdf_canvas.setStrokeColor(RenderingUtils.hex_color(color))
             pdf_canvas.setLineWidth(2.0)
 
-            # Draw check mark as two lines
+            # Draw check mark as one two-segment path
             margin = size * 0.2
             mid_x = x + size * 0.4
             mid_y = y + size * 0.3
 
-            # First line: bottom-left to middle
-            pdf_canvas.line(
-                x + margin, y + size * 0.5,
-                mid_x, mid_y
-            )
-
-            # Second line: middle to top-right
-            pdf_canvas.line(
-                mid_x, mid_y,
-                x + size - margin, y + size - margin
-            )
+            check = pdf_canvas.beginPath()
+            # First segment: bottom-left to middle
+            check.moveTo(x + margin, y + size * 0.5)
+            check.lineTo(mid_x, mid_y)
+            # Second segment: middle to top-right
+            check.lineTo(x + size - margin, y + size - margin)
+            pdf_canvas.drawPath(check, stroke=1, fill=0)
 
         except Exception as e:
             logger.warning(f"Failed to draw check mark: {e}")
@@ -7,17 +7,341 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import os
+import re
+import ssl
+import hashlib
+import time
 import logging
-from typing import Optional
+import threading
+import http.client
+import urllib.request
+from urllib.parse import urljoin, urlsplit
+from binascii import a2b_base64
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
 from io import BytesIO
+import numpy as np
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
 
 from ..schema import Widget
 from .base import BaseWidgetRenderer, RenderingError
 
+try:
+    import simplejpeg  # Optional extra "images": faster (libjpeg-turbo) decoding of JPEGs that get transformed
+except ImportError:
+    simplejpeg = None
+
 logger = logging.getLogger(__name__)
 
+# Decoded image bytes kept per renderer instance, shared by every widget (and
+# page) using the same source
+_SOURCE_CACHE_SIZE = 128
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)')
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]+={0,2}')
+# Long strings are classified from a sample of their ends instead of a full scan
+_BASE64_SAMPLE_WINDOW = 128
+_BASE64_SAMPLE_HEAD = 64
+_BASE64_SAMPLE_TAIL = 8
+
+# Prepared (decoded and transformed) images kept per renderer instance
+_IMAGE_CACHE_SIZE = 64
+
+# Images far larger than their drawn size on the device are shrunk before
+# embedding, keeping this many times the device resolution for zooming
+_DOWNSCALE_HEADROOM = 2
+_DOWNSCALED_JPEG_QUALITY = 90
+
+# Package root, for resolving relative asset paths
+_PKG_BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Where each local image source was found; only hits are cached so files added
+# later are still picked up, and stale hits are searched again
+_LOCAL_PATH_CACHE_SIZE = 256
+_LOCAL_PATH_CACHE: Dict[Tuple[str, str], str] = {}
+
+# Idle keep-alive connections per (scheme, host), so images from one host share a
+# TCP/TLS connection instead of a new handshake per image
+_HTTP_HEADERS = {'User-Agent': 'einkpdf/0.2 (+https://github.com/einkpdf)'}
+_HTTP_TIMEOUT = 10
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_HTTP_CONNECTIONS: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+_HTTP_CONNECTIONS_LOCK = threading.Lock()
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+
+
+def _source_digest(src: str) -> bytes:
+    """Short digest of an inline image source, used as its cache key."""
+    return hashlib.blake2b(src.encode('utf-8'), digest_size=16).digest()
+
+
+def _decode_data_uri(src: str) -> bytes:
+    """Decode the payload of a base64 data URI."""
+    # Format: data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...
+    header, b64data = src.split(',', 1)
+    return a2b_base64(b64data)
+
+
+def _decode_base64(src: str) -> bytes:
+    """Decode a raw base64 string (no data URI prefix); surrounding whitespace is skipped."""
+    return a2b_base64(src)
+
+
+def _read_local_file(path: str) -> bytes:
+    """Read an image file."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _find_local_image(src: str) -> Optional[str]:
+    """Locate a local image file (as given, then in the package assets), or None."""
+    # Try absolute path, then relative to current working directory
+    if os.path.exists(src):
+        return os.path.abspath(src)
+
+    # Try package assets directory
+    cleaned_path = src.lstrip('/').lstrip('./')
+    asset_path = os.path.normpath(os.path.join(_PKG_BASE_DIR, 'assets', cleaned_path))
+    if os.path.exists(asset_path):
+        return asset_path
+
+    # Try if path already contains 'assets/'
+    if cleaned_path.startswith('assets/'):
+        asset_path2 = os.path.normpath(os.path.join(_PKG_BASE_DIR, cleaned_path))
+        if os.path.exists(asset_path2):
+            return asset_path2
+
+    return None
+
+
+@lru_cache(maxsize=64)
+def _opacity_lut(opacity: float) -> Tuple[int, ...]:
+    """256-entry alpha lookup table for an opacity (truncating, like int(x * opacity))."""
+    return tuple((np.arange(256) * opacity).astype(np.uint8).tolist())
+
+
+def _scale_alpha(alpha, opacity: float):
+    """Multiply an 'L' alpha band by opacity through a C-level lookup table."""
+    return alpha.point(_opacity_lut(opacity))
+
+
+def _decode_jpeg_fast(pil_img, fp):
+    """
+    Decode a JPEG with simplejpeg when available, else return None.
+
+    Only used for images that are about to be transformed; untransformed JPEGs
+    keep going to the PDF as-is.
+    """
+    if simplejpeg is None or getattr(pil_img, 'format', None) != 'JPEG' or pil_img.mode not in ('RGB', 'L'):
+        return None
+    from PIL import Image
+
+    data = fp.getvalue() if hasattr(fp, 'getvalue') else None
+    if not data:
+        return None
+    if pil_img.mode == 'L':
+        pixels = simplejpeg.decode_jpeg(data, colorspace='GRAY')
+        return Image.fromarray(pixels[:, :, 0])
+    return Image.fromarray(simplejpeg.decode_jpeg(data, colorspace='RGB'))
+
+
+class _DrawBox(NamedTuple):
+    """Where an image is drawn, in PDF coordinates."""
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+@lru_cache(maxsize=1024)
+def _fit_image(image_width: float, image_height: float,
+               widget_width: float, widget_height: float,
+               fit_mode: str) -> Tuple[float, float, float, float]:
+    """
+    Image placement relative to the widget origin: (x offset, y offset, width, height).
+
+    Only depends on sizes, so a widget repeated on every page computes it once.
+    """
+    if fit_mode == 'fit':
+        # Preserve aspect ratio, fit within widget bounds, center
+        if image_width <= 0 or image_height <= 0:
+            scale = 1.0
+        else:
+            scale = min(widget_width / image_width, widget_height / image_height)
+
+        draw_width = image_width * scale
+        draw_height = image_height * scale
+        return (widget_width - draw_width) / 2, (widget_height - draw_height) / 2, draw_width, draw_height
+
+    if fit_mode == 'actual':
+        # Use original image size, position at widget top-left
+        return 0, 0, image_width, image_height
+
+    # 'stretch' or unknown: fill entire widget area, may distort aspect ratio
+    return 0, 0, widget_width, widget_height
+
+
+def _downscale_factor(image_width: float, image_height: float,
+                      draw_width: float, draw_height: float, ppi: float) -> int:
+    """Integer factor an image can shrink by and still cover its drawn size (1 = keep)."""
+    if min(image_width, image_height, draw_width, draw_height) <= 0:
+        return 1
+    pixels_per_point = ppi / 72 * _DOWNSCALE_HEADROOM
+    factor = int(min(image_width / (draw_width * pixels_per_point),
+                     image_height / (draw_height * pixels_per_point)))
+    return factor if factor >= 2 else 1
+
+
+def _reduced_image(img_reader: ImageReader, factor: int):
+    """
+    Decode an image reduced by an integer factor, or None if it has no pixels to read.
+
+    Stream sources are decoded from a fresh Image.open() of their bytes, with
+    JPEGs scaled down by libjpeg (draft) as they are decoded, so the full-size
+    pixels are never held. Transformed images are already in memory and are
+    reduced directly.
+    """
+    from PIL import Image
+
+    fp = getattr(img_reader, 'fp', None)
+    if fp is None:
+        pil_img = getattr(img_reader, '_image', None)
+        return pil_img.reduce(factor) if pil_img is not None else None
+
+    fp.seek(0)
+    with Image.open(BytesIO(fp.read())) as source:
+        full_size = source.size
+        size = (-(-source.width // factor), -(-source.height // factor))
+        if source.format == 'JPEG':
+            source.draft(source.mode, size)
+        if source.size == full_size:
+            return source.reduce(factor)
+        if source.size == size:
+            return source.copy()
+        return source.resize(size, Image.Resampling.BOX)
+
+
+def _device_ppi(profile: Any) -> Optional[float]:
+    """Display resolution of a device profile, or None if it has none."""
+    display = getattr(profile, 'display', None)
+    ppi = display.get('ppi') if isinstance(display, dict) else None
+    if isinstance(ppi, (int, float)) and not isinstance(ppi, bool) and ppi > 0:
+        return float(ppi)
+    return None
+
+
+def _image_cache_key(source: Any, convert_to_grayscale: Any,
+                     opacity: Any) -> Optional[Tuple[Any, bool, Any]]:
+    """Key identifying a prepared image, or None when the values are unhashable."""
+    cache_key = (source, bool(convert_to_grayscale), opacity)
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def _bytes_to_reader(data: bytes) -> ImageReader:
+    """
+    Wrap encoded image bytes for reportlab.
+
+    The bytes go in as a stream rather than an opened PIL image so that JPEGs
+    keep reportlab's passthrough and are embedded without re-encoding.
+    """
+    return ImageReader(BytesIO(data))
+
+
+def _pil_to_reader(pil_img) -> ImageReader:
+    """Wrap a transformed PIL image for reportlab, which compresses the pixels itself."""
+    return ImageReader(pil_img)
+
+
+def _new_http_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """Open a connection for a host (TLS context shared by all HTTPS connections)."""
+    global _SSL_CONTEXT
+    if scheme == 'https':
+        if _SSL_CONTEXT is None:
+            _SSL_CONTEXT = ssl.create_default_context()
+        return http.client.HTTPSConnection(netloc, timeout=_HTTP_TIMEOUT, context=_SSL_CONTEXT)
+    return http.client.HTTPConnection(netloc, timeout=_HTTP_TIMEOUT)
+
+
+def _http_request(scheme: str, netloc: str, path: str,
+                  headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """GET over a pooled keep-alive connection, retrying once if a pooled one went stale."""
+    key = (scheme, netloc)
+    with _HTTP_CONNECTIONS_LOCK:
+        conn = _HTTP_CONNECTIONS.pop(key, None)
+    reused = conn is not None
+    if conn is None:
+        conn = _new_http_connection(scheme, netloc)
+
+    while True:
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server may have closed an idle connection; try a fresh one
+            reused = False
+            conn = _new_http_connection(scheme, netloc)
+
+    if response.will_close:
+        conn.close()
+    else:
+        with _HTTP_CONNECTIONS_LOCK:
+            if key in _HTTP_CONNECTIONS:
+                conn.close()
+            else:
+                _HTTP_CONNECTIONS[key] = conn
+    return response.status, response.headers, body
+
+
+def _http_get(url: str, extra_headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """GET a URL, following redirects; proxied hosts go through urllib instead."""
+    headers = {**_HTTP_HEADERS, **extra_headers}
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            raise ValueError(f"unsupported image URL '{url}'")
+
+        proxies = urllib.request.getproxies()
+        if proxies.get(parts.scheme) and not urllib.request.proxy_bypass(parts.hostname or ''):
+            # Proxy handling is left to urllib (no connection reuse, no revalidation)
+            req = urllib.request.Request(url, headers=_HTTP_HEADERS)
+            with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT) as response:
+                return response.status, response.headers, response.read()
+
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        status, response_headers, body = _http_request(parts.scheme, parts.netloc, path, headers)
+
+        location = response_headers.get('Location')
+        if status in _HTTP_REDIRECT_CODES and location:
+            url = urljoin(url, location)
+            continue
+        return status, response_headers, body
+
+    raise ValueError(f"too many redirects for image URL '{url}'")
+
+
+def _cache_max_age(cache_control: Optional[str]) -> int:
+    """Seconds a response may be reused according to its Cache-Control header."""
+    if not cache_control:
+        return 0
+    directives = cache_control.lower()
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0
+    match = _MAX_AGE_RE.search(directives)
+    return int(match.group(1)) if match else 0
+
 
 class ImageRenderer(BaseWidgetRenderer):
     """
@@ -28,6 +352,24 @@ class ImageRenderer(BaseWidgetRenderer):
     Following CLAUDE.md rule #1: No dummy implementations - complete functionality.
     """
 
+    def __init__(self, converter, strict_mode: bool = False):
+        """Initialize image renderer with a cache of prepared images."""
+        super().__init__(converter, strict_mode)
+        # (source, grayscale, opacity) -> (ImageReader, (width, height)); lets a
+        # logo repeated on every page be decoded and transformed only once
+        self._image_cache: Dict[Tuple[Any, bool, Any], Tuple[ImageReader, Tuple[float, float]]] = {}
+        # (image cache key, factor) -> reduced ImageReader for the device
+        self._downscaled_cache: Dict[Tuple[Tuple[Any, bool, Any], int], ImageReader] = {}
+        self._device_ppi: Optional[float] = None
+        # Decoded source bytes: ('data'|'base64', digest) or ('file', path, mtime_ns, size)
+        # -> bytes. Kept per instance so they are released with the render
+        self._source_cache: Dict[Tuple[Any, ...], bytes] = {}
+        # Remote images are reused while the server's Cache-Control max-age allows it, and
+        # revalidated with ETag/Last-Modified after that: url -> (expires, data, validators)
+        self._remote_cache: Dict[str, Tuple[float, bytes, Dict[str, str]]] = {}
+        # prepare_batch() resolves sources on worker threads
+        self._source_lock = threading.Lock()
+
     @property
     def supported_widget_types(self) -> list[str]:
         return ['image']
@@ -35,6 +377,7 @@ class ImageRenderer(BaseWidgetRenderer):
     def render(self, pdf_canvas: canvas.Canvas, widget: Widget, **kwargs) -> None:
         """Render image widget based on its properties."""
         self.validate_widget(widget)
+        self._device_ppi = _device_ppi(kwargs.get('profile'))
 
         if widget.type == 'image':
             self._render_image(pdf_canvas, widget)
@@ -43,7 +386,7 @@ class ImageRenderer(BaseWidgetRenderer):
 
     def _render_image(self, pdf_canvas: canvas.Canvas, widget: Widget) -> None:
         """Render an image widget with proper scaling and positioning."""
-        props = getattr(widget, 'properties', {}) or {}
+        props = widget.properties or {}
 
         # Get image source and fit mode
         # Support both image_src (URL/path) and image_data (base64)
@@ -59,43 +402,19 @@ class ImageRenderer(BaseWidgetRenderer):
 
         # Prioritize image_data over image_src
         source = image_data if image_data else src
-
-        # Resolve image source to ImageReader
-        img_reader = self._resolve_image_reader(source)
-        if not img_reader:
-            if self.strict_mode:
-                raise RenderingError(f"Image widget '{widget.id}': cannot load image from '{src}'")
-            logger.warning(f"Skipping image widget {widget.id}: source not found: {src}")
-            return
-
-        # Convert to grayscale if requested
         convert_to_grayscale = props.get('convert_to_grayscale', False)
-        if convert_to_grayscale:
-            img_reader = self._convert_to_grayscale(img_reader, widget.id)
-            if not img_reader:
-                if self.strict_mode:
-                    raise RenderingError(f"Image widget '{widget.id}': failed to convert to grayscale")
-                logger.warning(f"Skipping image widget {widget.id}: grayscale conversion failed")
-                return
-
-        # Apply opacity if specified (useful for e-ink to reduce darkness)
         opacity = props.get('opacity')
-        if opacity is not None and opacity < 1.0:
-            img_reader = self._apply_opacity(img_reader, opacity, widget.id)
-            if not img_reader:
-                if self.strict_mode:
-                    raise RenderingError(f"Image widget '{widget.id}': failed to apply opacity")
-                logger.warning(f"Skipping image widget {widget.id}: opacity application failed")
+
+        cache_key = _image_cache_key(source, convert_to_grayscale, opacity)
+        prepared = self._image_cache.get(cache_key) if cache_key is not None else None
+
+        if prepared is None:
+            prepared = self._prepare_image(widget, source, src, convert_to_grayscale, opacity)
+            if prepared is None:
                 return
+            self._store_prepared(cache_key, prepared)
 
-        # Get image intrinsic size
-        try:
-            image_width, image_height = img_reader.getSize()
-        except Exception as e:
-            if self.strict_mode:
-                raise RenderingError(f"Image widget '{widget.id}': failed to read image size: {e}") from e
-            logger.warning(f"Skipping image widget {widget.id}: failed to read size: {e}")
-            return
+        img_reader, (image_width, image_height) = prepared
 
         # Get widget position in PDF coordinates
         box = self.converter.convert_position_for_drawing(widget.position)
@@ -105,18 +424,22 @@ class ImageRenderer(BaseWidgetRenderer):
         widget_height = box['height']
 
         # Calculate drawing dimensions and position based on fit mode
-        draw_info = self._calculate_draw_dimensions(
+        draw_box = self._calculate_draw_dimensions(
             image_width, image_height,
             widget_x, widget_y, widget_width, widget_height,
             fit
         )
 
+        if self._device_ppi:
+            img_reader = self._downscale_for_device(cache_key, img_reader, (image_width, image_height),
+                                                    draw_box, widget.id)
+
         # Draw the image
         try:
             pdf_canvas.drawImage(
                 img_reader,
-                draw_info['x'], draw_info['y'],
-                width=draw_info['width'], height=draw_info['height'],
+                draw_box.x, draw_box.y,
+                width=draw_box.width, height=draw_box.height,
                 preserveAspectRatio=False,
                 mask='auto'
             )
@@ -125,68 +448,252 @@ class ImageRenderer(BaseWidgetRenderer):
                 raise RenderingError(f"Image widget '{widget.id}': failed to draw image: {e}") from e
             logger.warning(f"Failed to draw image {widget.id}: {e}")
 
-    def _convert_to_grayscale(self, img_reader: ImageReader, widget_id: str) -> Optional[ImageReader]:
+    def _downscale_for_device(self, cache_key: Optional[Tuple[Any, bool, Any]], img_reader: ImageReader,
+                              image_size: Tuple[float, float], draw_box: _DrawBox,
+                              widget_id: str) -> ImageReader:
         """
-        Convert image to grayscale.
+        Shrink an image that is much larger than it will appear on the device.
+
+        The image is reduced by an integer factor (box filter), so it still has at
+        least _DOWNSCALE_HEADROOM times the device resolution at its drawn size.
+        JPEG sources are re-encoded as JPEG to keep the embedded stream compact.
+        The reduction is decoded separately; img_reader, which stays in the
+        prepared-image cache, never has its full-size pixels loaded.
+
+        Returns:
+            The reduced ImageReader, or img_reader when no reduction applies
+        """
+        factor = _downscale_factor(image_size[0], image_size[1], draw_box.width, draw_box.height,
+                                   self._device_ppi)
+        if factor == 1:
+            return img_reader
+
+        downscaled_key = (cache_key, factor) if cache_key is not None else None
+        cached = self._downscaled_cache.get(downscaled_key) if downscaled_key is not None else None
+        if cached is not None:
+            return cached
+
+        try:
+            reduced = _reduced_image(img_reader, factor)
+            if reduced is None:
+                return img_reader
+            # jpeg_fh() is only non-None for untransformed JPEG sources (passthrough);
+            # everything else, line art included, stays lossless
+            if img_reader.jpeg_fh() is not None and reduced.mode in ('RGB', 'L'):
+                buffer = BytesIO()
+                reduced.save(buffer, format='JPEG', quality=_DOWNSCALED_JPEG_QUALITY)
+                buffer.seek(0)
+                downscaled = ImageReader(buffer)
+            else:
+                downscaled = _pil_to_reader(reduced)
+        except Exception as e:
+            logger.debug(f"Keeping full-size image for widget {widget_id}: {e}")
+            return img_reader
+
+        if downscaled_key is not None:
+            if len(self._downscaled_cache) >= _IMAGE_CACHE_SIZE:
+                self._downscaled_cache.clear()
+            self._downscaled_cache[downscaled_key] = downscaled
+        return downscaled
+
+    def prepare_batch(self, widgets: Iterable[Widget]) -> None:
+        """
+        Prepare the images of several widgets concurrently.
+
+        File/network reads and Pillow transforms release the GIL, so the distinct
+        images of a page are resolved and transformed on a thread pool and cached;
+        render() then only draws them. Pixel data is not decoded here, so JPEGs
+        embedded as-is are never decoded and no RGB buffers are kept in the cache.
+        Failures are left for render() to repeat and report.
 
         Args:
-            img_reader: Original ImageReader
-            widget_id: Widget ID for error reporting
+            widgets: Widgets about to be rendered (non-image widgets are ignored)
+        """
+        pending: Dict[Tuple[Any, bool, Any], Tuple[Widget, Any, Any, Any, Any]] = {}
+        for widget in widgets:
+            if widget.type != 'image':
+                continue
+            props = widget.properties or {}
+            src = props.get('image_src')
+            image_data = props.get('image_data')
+            if not src and not image_data:
+                continue
+            source = image_data if image_data else src
+            convert_to_grayscale = props.get('convert_to_grayscale', False)
+            opacity = props.get('opacity')
+            cache_key = _image_cache_key(source, convert_to_grayscale, opacity)
+            if cache_key is None or cache_key in self._image_cache or cache_key in pending:
+                continue
+            pending[cache_key] = (widget, source, src, convert_to_grayscale, opacity)
+
+        workers = min(len(pending), os.cpu_count() or 1)
+        if workers < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda job: self._prepare_image_quietly(*job), pending.values()))
+        for cache_key, prepared in zip(pending, results):
+            if prepared is not None:
+                self._store_prepared(cache_key, prepared)
+
+    def _prepare_image_quietly(self, widget: Widget, source: Any, src: Any, convert_to_grayscale: Any,
+                               opacity: Any) -> Optional[Tuple[ImageReader, Tuple[float, float]]]:
+        """Prepare an image on a worker thread; failures are repeated and reported by render()."""
+        try:
+            return self._prepare_image(widget, source, src, convert_to_grayscale, opacity,
+                                       report=False)
+        except Exception as e:
+            logger.debug(f"Batch preparation failed for image widget {widget.id}: {e}")
+            return None
+
+    def _store_prepared(self, cache_key: Optional[Tuple[Any, bool, Any]],
+                        prepared: Tuple[ImageReader, Tuple[float, float]]) -> None:
+        """Remember a prepared image (unhashable keys are not cached)."""
+        if cache_key is None:
+            return
+        if len(self._image_cache) >= _IMAGE_CACHE_SIZE:
+            self._image_cache.clear()
+        self._image_cache[cache_key] = prepared
+
+    def _prepare_image(self, widget: Widget, source: Any, src: Any, convert_to_grayscale: Any,
+                       opacity: Any, report: bool = True) -> Optional[Tuple[ImageReader, Tuple[float, float]]]:
+        """
+        Resolve, transform and measure an image.
+
+        Args:
+            widget: Widget being rendered (for error reporting)
+            source: Image source (image_data or image_src)
+            src: image_src property (for error messages)
+            convert_to_grayscale: Whether to convert to grayscale
+            opacity: Opacity property value (None for unchanged)
+            report: Raise (strict mode) or log on failure; False just returns None
 
         Returns:
-            New ImageReader with grayscale image or None on failure
+            Tuple of (ImageReader, (width, height)) or None if the widget is skipped
+
+        Raises:
+            RenderingError: If the image cannot be prepared in strict mode
         """
+        def fail(error: str, warning: str, cause: Optional[Exception] = None) -> None:
+            if report:
+                if self.strict_mode:
+                    raise RenderingError(f"Image widget '{widget.id}': {error}") from cause
+                logger.warning(f"Skipping image widget {widget.id}: {warning}")
+            return None
+
+        # Resolve image source to ImageReader
+        img_reader = self._resolve_image_reader(source)
+        if not img_reader:
+            return fail(f"cannot load image from '{src}'", f"source not found: {src}")
+
+        # Grayscale and opacity work on one in-memory PIL image, which is
+        # handed to reportlab directly after all transforms
+        apply_opacity = opacity is not None and opacity < 1.0
+        if convert_to_grayscale or apply_opacity:
+            pil_img = self._extract_pil_image(img_reader, widget.id)
+            transformed = pil_img
+
+            # Convert to grayscale if requested
+            if convert_to_grayscale:
+                if pil_img is not None:
+                    transformed = self._convert_to_grayscale(pil_img, widget.id)
+                if transformed is None:
+                    return fail("failed to convert to grayscale", "grayscale conversion failed")
+
+            # Apply opacity if specified (useful for e-ink to reduce darkness)
+            if apply_opacity and transformed is not None:
+                transformed = self._apply_opacity(transformed, opacity, widget.id)
+
+            if transformed is not None and transformed is not pil_img:
+                try:
+                    img_reader = _pil_to_reader(transformed)
+                except Exception as e:
+                    return fail(f"failed to wrap transformed image: {e}",
+                                f"failed to wrap transformed image: {e}", e)
+
+        # Get image intrinsic size
         try:
-            from PIL import Image
+            image_size = img_reader.getSize()
+        except Exception as e:
+            return fail(f"failed to read image size: {e}", f"failed to read size: {e}", e)
+
+        return img_reader, image_size
+
+    def _extract_pil_image(self, img_reader: ImageReader, widget_id: str):
+        """
+        Get the PIL image behind an ImageReader.
 
-            # Get PIL Image from ImageReader
+        Args:
+            img_reader: ImageReader to extract from
+            widget_id: Widget ID for error reporting
+
+        Returns:
+            PIL Image or None if it cannot be extracted
+        """
+        try:
             pil_img = img_reader._image if hasattr(img_reader, '_image') else None
 
             if pil_img is None:
                 # Try to extract from ImageReader's internal file pointer
                 if hasattr(img_reader, 'fp'):
+                    from PIL import Image
                     img_reader.fp.seek(0)
                     pil_img = Image.open(img_reader.fp)
+                    pil_img.load()
+                    # Keep it on the reader so later use doesn't parse the stream again
+                    img_reader._image = pil_img
                 else:
                     logger.debug(f"Cannot extract PIL image from ImageReader for widget {widget_id}")
                     return None
 
-            # Convert to grayscale
-            if pil_img.mode != 'L':  # L = 8-bit grayscale
-                grayscale_img = pil_img.convert('L')
-            else:
-                grayscale_img = pil_img
+            try:
+                fast_img = _decode_jpeg_fast(pil_img, getattr(img_reader, 'fp', None))
+            except Exception as e:
+                logger.debug(f"simplejpeg decode failed for widget {widget_id}, using Pillow: {e}")
+                fast_img = None
+            return fast_img if fast_img is not None else pil_img
 
-            # Create new ImageReader from grayscale image
-            img_buffer = BytesIO()
-            grayscale_img.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
+        except Exception as e:
+            logger.debug(f"Failed to extract PIL image for widget {widget_id}: {e}")
+            return None
 
-            return ImageReader(img_buffer)
+    def _convert_to_grayscale(self, pil_img, widget_id: str):
+        """
+        Convert image to grayscale.
+
+        Args:
+            pil_img: Original PIL image
+            widget_id: Widget ID for error reporting
+
+        Returns:
+            Grayscale PIL image or None on failure
+        """
+        try:
+            # Convert to grayscale
+            if pil_img.mode != 'L':  # L = 8-bit grayscale
+                return pil_img.convert('L')
+            return pil_img
 
-        except ImportError:
-            logger.warning(f"PIL/Pillow not available for grayscale conversion in widget {widget_id}")
-            return img_reader  # Return original if PIL not available
         except Exception as e:
             logger.debug(f"Failed to convert image to grayscale for widget {widget_id}: {e}")
             return None
 
-    def _apply_opacity(self, img_reader: ImageReader, opacity: float, widget_id: str) -> Optional[ImageReader]:
+    def _apply_opacity(self, pil_img, opacity: float, widget_id: str):
         """
         Apply opacity/transparency to image to reduce darkness for e-ink displays.
 
         Args:
-            img_reader: Original ImageReader
+            pil_img: Original PIL image
             opacity: Opacity value (0.0=fully transparent, 1.0=fully opaque)
             widget_id: Widget ID for error reporting
 
         Returns:
-            New ImageReader with opacity applied or None on failure
+            PIL image with opacity applied (the original on failure)
         """
         # Validate opacity value
         if not isinstance(opacity, (int, float)):
             logger.warning(f"Invalid opacity type for widget {widget_id}: {type(opacity)}")
-            return img_reader
+            return pil_img
 
         if opacity < 0.0 or opacity > 1.0:
             logger.warning(f"Opacity value {opacity} out of range [0.0, 1.0] for widget {widget_id}")
@@ -195,60 +702,54 @@ class ImageRenderer(BaseWidgetRenderer):
 
         # Opacity 1.0 means no change
         if opacity >= 1.0:
-            return img_reader
+            return pil_img
 
         try:
             from PIL import Image
 
-            # Get PIL Image from ImageReader
-            pil_img = img_reader._image if hasattr(img_reader, '_image') else None
+            # A fully transparent image stays fully transparent at any opacity
+            if pil_img.mode in ('RGBA', 'LA') and pil_img.getchannel('A').getextrema()[1] == 0:
+                return pil_img
 
-            if pil_img is None:
-                # Try to extract from ImageReader's internal file pointer
-                if hasattr(img_reader, 'fp'):
-                    img_reader.fp.seek(0)
-                    pil_img = Image.open(img_reader.fp)
-                else:
-                    logger.debug(f"Cannot extract PIL image from ImageReader for widget {widget_id}")
-                    return img_reader  # Return original if can't extract
+            # Opaque grayscale/RGB images get a constant alpha in one step,
+            # instead of adding an alpha band, splitting and scaling it
+            if pil_img.mode in ('L', 'RGB'):
+                pil_img_alpha = pil_img.convert('LA' if pil_img.mode == 'L' else 'RGBA')
+                pil_img_alpha.putalpha(_opacity_lut(opacity)[255])
+                return pil_img_alpha
 
             # Ensure image has alpha channel
             if pil_img.mode not in ('RGBA', 'LA'):
                 # Convert to RGBA to add alpha channel
                 if pil_img.mode == 'L':
-                    pil_img = pil_img.convert('LA')
+                    pil_img_alpha = pil_img.convert('LA')
                 else:
-                    pil_img = pil_img.convert('RGBA')
+                    pil_img_alpha = pil_img.convert('RGBA')
+            else:
+                pil_img_alpha = pil_img
 
             # Apply opacity by adjusting alpha channel
             # Split into bands, multiply alpha by opacity factor
-            if pil_img.mode == 'RGBA':
-                r, g, b, a = pil_img.split()
+            if pil_img_alpha.mode == 'RGBA':
+                r, g, b, a = pil_img_alpha.split()
                 # Apply opacity to alpha channel
-                a = a.point(lambda x: int(x * opacity))
-                result_img = Image.merge('RGBA', (r, g, b, a))
-            elif pil_img.mode == 'LA':
-                l, a = pil_img.split()
-                a = a.point(lambda x: int(x * opacity))
-                result_img = Image.merge('LA', (l, a))
+                a = _scale_alpha(a, opacity)
+                return Image.merge('RGBA', (r, g, b, a))
+            elif pil_img_alpha.mode == 'LA':
+                l, a = pil_img_alpha.split()
+                a = _scale_alpha(a, opacity)
+                return Image.merge('LA', (l, a))
             else:
                 # Fallback - should not reach here
-                logger.warning(f"Unexpected image mode {pil_img.mode} for opacity in widget {widget_id}")
-                return img_reader
-
-            # Create new ImageReader from modified image
-            img_buffer = BytesIO()
-            result_img.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
-
-            return ImageReader(img_buffer)
+                logger.warning(f"Unexpected image mode {pil_img_alpha.mode} for opacity in widget {widget_id}")
+                return pil_img
 
         except ImportError:
             logger.warning(f"PIL/Pillow not available for opacity adjustment in widget {widget_id}")
-            return img_reader  # Return original if PIL not available
+            return pil_img  # Return original if PIL not available
         except Exception as e:
             logger.debug(f"Failed to apply opacity for widget {widget_id}: {e}")
-            return img_reader  # Return original on error
+            return pil_img  # Return original on error
 
     def _resolve_image_reader(self, src: str) -> Optional[ImageReader]:
         """
@@ -275,7 +776,8 @@ class ImageRenderer(BaseWidgetRenderer):
             # Handle raw base64 strings (without data URI prefix)
             # This handles image_data property which may be stored as plain base64
             elif self._is_base64_string(src):
-                return self._resolve_base64(src)
+                img_reader = self._resolve_base64(src)
+                return img_reader if img_reader else self._resolve_local_path(src)
 
             # Handle local file paths
             else:
@@ -291,17 +793,37 @@ class ImageRenderer(BaseWidgetRenderer):
         if len(src) < 100:  # Too short to be meaningful image data
             return False
         # Check if string contains only base64 characters
-        import re
-        return bool(re.match(r'^[A-Za-z0-9+/]+={0,2}$', src.strip()))
+        if len(src) <= 2 * _BASE64_SAMPLE_WINDOW:
+            return _BASE64_RE.fullmatch(src.strip()) is not None
+        # Base64 is uniform, so the start and the (padded) end are enough to tell it
+        # apart from a file path; undecodable data still falls back to the path lookup
+        head = src[:_BASE64_SAMPLE_WINDOW].lstrip()[:_BASE64_SAMPLE_HEAD]
+        tail = src[-_BASE64_SAMPLE_WINDOW:].rstrip()[-_BASE64_SAMPLE_TAIL:]
+        return _BASE64_RE.fullmatch(head + tail) is not None
+
+    def _source_bytes(self, key: Tuple[Any, ...], load: Callable[[], bytes]) -> bytes:
+        """Bytes of a source from the cache, loading and caching them on a miss."""
+        with self._source_lock:
+            data = self._source_cache.get(key)
+        if data is None:
+            data = load()
+            with self._source_lock:
+                if len(self._source_cache) >= _SOURCE_CACHE_SIZE:
+                    self._source_cache.clear()
+                self._source_cache[key] = data
+        return data
+
+    def _local_file_bytes(self, path: str) -> bytes:
+        """Contents of a local image file; mtime and size are part of the key so edits are picked up."""
+        stat = os.stat(path)
+        return self._source_bytes(('file', path, stat.st_mtime_ns, stat.st_size),
+                                  lambda: _read_local_file(path))
 
     def _resolve_data_uri(self, src: str) -> Optional[ImageReader]:
         """Resolve data URI to ImageReader."""
         try:
-            import base64
-            # Format: data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...
-            header, b64data = src.split(',', 1)
-            raw_data = base64.b64decode(b64data)
-            return ImageReader(BytesIO(raw_data))
+            return _bytes_to_reader(self._source_bytes(('data', _source_digest(src)),
+                                                       lambda: _decode_data_uri(src)))
         except Exception as e:
             logger.debug(f"Failed to decode data URI: {e}")
             return None
@@ -309,10 +831,8 @@ class ImageRenderer(BaseWidgetRenderer):
     def _resolve_base64(self, src: str) -> Optional[ImageReader]:
         """Resolve raw base64 string to ImageReader."""
         try:
-            import base64
-            # Decode raw base64 string (no data URI prefix)
-            raw_data = base64.b64decode(src.strip())
-            return ImageReader(BytesIO(raw_data))
+            return _bytes_to_reader(self._source_bytes(('base64', _source_digest(src)),
+                                                       lambda: _decode_base64(src)))
         except Exception as e:
             logger.debug(f"Failed to decode base64 string: {e}")
             return None
@@ -320,13 +840,36 @@ class ImageRenderer(BaseWidgetRenderer):
     def _resolve_remote_url(self, src: str) -> Optional[ImageReader]:
         """Resolve remote URL to ImageReader."""
         try:
-            import urllib.request
-            req = urllib.request.Request(src, headers={
-                'User-Agent': 'einkpdf/0.2 (+https://github.com/einkpdf)'
-            })
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = response.read()
-            return ImageReader(BytesIO(data))
+            with self._source_lock:
+                cached = self._remote_cache.get(src)
+            if cached and cached[0] > time.monotonic():
+                return _bytes_to_reader(cached[1])
+
+            # Expired entries are revalidated instead of downloaded again
+            status, headers, data = _http_get(src, cached[2] if cached else {})
+            if status == 304 and cached:
+                data = cached[1]
+            elif status != 200:
+                raise ValueError(f"HTTP {status}")
+
+            cache_control = headers.get('Cache-Control') or ''
+            validators = {}
+            if headers.get('ETag'):
+                validators['If-None-Match'] = headers['ETag']
+            if headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = headers['Last-Modified']
+            if status == 304 and cached:
+                validators = validators or cached[2]
+            max_age = _cache_max_age(cache_control)
+
+            with self._source_lock:
+                if 'no-store' not in cache_control.lower() and (max_age > 0 or validators):
+                    if len(self._remote_cache) >= _SOURCE_CACHE_SIZE:
+                        self._remote_cache.clear()
+                    self._remote_cache[src] = (time.monotonic() + max_age, data, validators)
+                else:
+                    self._remote_cache.pop(src, None)
+            return _bytes_to_reader(data)
         except Exception as e:
             logger.debug(f"Failed to fetch remote image '{src}': {e}")
             return None
@@ -334,27 +877,23 @@ class ImageRenderer(BaseWidgetRenderer):
     def _resolve_local_path(self, src: str) -> Optional[ImageReader]:
         """Resolve local file path to ImageReader."""
         try:
-            # Try absolute path
-            if os.path.isabs(src) and os.path.exists(src):
-                return ImageReader(src)
-
-            # Try relative to current working directory
-            if os.path.exists(src):
-                return ImageReader(src)
-
-            # Try package assets directory
-            cleaned_path = src.lstrip('/').lstrip('./')
-            base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..'))
-            asset_path = os.path.normpath(os.path.join(base_dir, 'assets', cleaned_path))
-
-            if os.path.exists(asset_path):
-                return ImageReader(asset_path)
-
-            # Try if path already contains 'assets/'
-            if cleaned_path.startswith('assets/'):
-                asset_path2 = os.path.normpath(os.path.join(base_dir, cleaned_path))
-                if os.path.exists(asset_path2):
-                    return ImageReader(asset_path2)
+            # Relative sources depend on the working directory, so it is part of the key
+            key = (src, os.getcwd())
+            path = _LOCAL_PATH_CACHE.get(key)
+            if path is not None:
+                try:
+                    return _bytes_to_reader(self._local_file_bytes(path))
+                except OSError:
+                    # File moved or deleted since it was found; search again
+                    _LOCAL_PATH_CACHE.pop(key, None)
+
+            path = _find_local_image(src)
+            if path is not None:
+                data = self._local_file_bytes(path)
+                if len(_LOCAL_PATH_CACHE) >= _LOCAL_PATH_CACHE_SIZE:
+                    _LOCAL_PATH_CACHE.clear()
+                _LOCAL_PATH_CACHE[key] = path
+                return _bytes_to_reader(data)
 
             # Final attempt - let ImageReader try
             return ImageReader(src)
@@ -366,7 +905,7 @@ class ImageRenderer(BaseWidgetRenderer):
     def _calculate_draw_dimensions(self, image_width: float, image_height: float,
                                   widget_x: float, widget_y: float,
                                   widget_width: float, widget_height: float,
-                                  fit_mode: str) -> dict:
+                                  fit_mode: str) -> _DrawBox:
         """
         Calculate final drawing dimensions and position for image.
 
@@ -380,40 +919,17 @@ class ImageRenderer(BaseWidgetRenderer):
             fit_mode: How to fit image ('fit', 'actual', 'stretch')
 
         Returns:
-            Dictionary with 'x', 'y', 'width', 'height' for drawing
+            _DrawBox with x, y, width, height for drawing
         """
-        if fit_mode == 'fit':
-            # Preserve aspect ratio, fit within widget bounds, center
-            if image_width <= 0 or image_height <= 0:
-                scale = 1.0
-            else:
-                scale = min(widget_width / image_width, widget_height / image_height)
-
-            draw_width = image_width * scale
-            draw_height = image_height * scale
-            draw_x = widget_x + (widget_width - draw_width) / 2
-            draw_y = widget_y + (widget_height - draw_height) / 2
-
-        elif fit_mode == 'actual':
-            # Use original image size, position at widget top-left
-            draw_width = image_width
-            draw_height = image_height
-            draw_x = widget_x
-            draw_y = widget_y
-
-        else:  # 'stretch' or unknown
-            # Fill entire widget area, may distort aspect ratio
-            draw_width = widget_width
-            draw_height = widget_height
-            draw_x = widget_x
-            draw_y = widget_y
-
-        return {
-            'x': draw_x,
-            'y': draw_y,
-            'width': draw_width,
-            'height': draw_height
-        }
+        try:
+            offset_x, offset_y, draw_width, draw_height = _fit_image(
+                image_width, image_height, widget_width, widget_height, fit_mode)
+        except TypeError:
+            # Unhashable fit mode bypasses the cache
+            offset_x, offset_y, draw_width, draw_height = _fit_image.__wrapped__(
+                image_width, image_height, widget_width, widget_height, fit_mode)
+
+        return _DrawBox(widget_x + offset_x, widget_y + offset_y, draw_width, draw_height)
 
     def get_supported_formats(self) -> list[str]:
         """Get list of supported image formats."""
@@ -429,7 +945,7 @@ class ImageRenderer(BaseWidgetRenderer):
         Raises:
             RenderingError: If properties are invalid
         """
-        props = getattr(widget, 'properties', {}) or {}
+        props = widget.properties or {}
 
         # Validate image source - either image_src or image_data required
         image_src = props.get('image_src')
@@ -7,7 +7,8 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from reportlab.pdfgen import canvas
 
 from ..schema import Widget
@@ -17,6 +18,34 @@ from ..tokens import TokenProcessor, RenderingTokenContext
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_LINK_RGB = (0.0, 0.4, 0.8)  # Default blue
+
+
+@lru_cache(maxsize=4096)
+def _normalize_page_destination(destination: str) -> str:
+    """Map 'page_N' in any case to the 'Page_N' bookmark name; other names are unchanged."""
+    lower = destination.lower()
+    if lower.startswith('page_'):
+        suffix = destination.split('_', 1)[1]
+        if suffix.isdigit():
+            return f"Page_{suffix}"
+
+    return destination
+
+
+@lru_cache(maxsize=256)
+def _parse_hex_rgb(hex_digits: str) -> Tuple[float, float, float]:
+    """Parse lower-case hex digits (no '#') to an RGB tuple, once per colour."""
+    if len(hex_digits) != 6:
+        return _DEFAULT_LINK_RGB
+    try:
+        r = int(hex_digits[0:2], 16) / 255.0
+        g = int(hex_digits[2:4], 16) / 255.0
+        b = int(hex_digits[4:6], 16) / 255.0
+    except ValueError:
+        return _DEFAULT_LINK_RGB
+    return (r, g, b)
+
 
 class LinkRenderer(BaseWidgetRenderer):
     """
@@ -31,6 +60,8 @@ class LinkRenderer(BaseWidgetRenderer):
         """Initialize link renderer with centralized TextEngine."""
         super().__init__(converter, strict_mode)
         self.text_engine = TextEngine(converter)
+        # Page_N destination names, indexed by page number (built per total_pages)
+        self._page_dests: list[str] = ['']
 
     @property
     def supported_widget_types(self) -> list[str]:
@@ -45,16 +76,16 @@ class LinkRenderer(BaseWidgetRenderer):
         enforcer = kwargs.get('enforcer')
 
         if widget.type == 'internal_link':
-            # Remove enforcer from kwargs to avoid duplicate parameter
-            kwargs_no_enforcer = {k: v for k, v in kwargs.items() if k != 'enforcer'}
-            self._render_internal_link(pdf_canvas, widget, enforcer, **kwargs_no_enforcer)
+            self._render_internal_link(pdf_canvas, widget, enforcer,
+                                       page_num=page_num, total_pages=kwargs.get('total_pages', 1))
         elif widget.type == 'tap_zone':
             total_pages = kwargs.get('total_pages', page_num)
             self._render_tap_zone(pdf_canvas, widget, page_num, total_pages, enforcer)
         else:
             raise RenderingError(f"Unsupported widget type: {widget.type}")
 
-    def _render_internal_link(self, pdf_canvas: canvas.Canvas, widget: Widget, enforcer=None, **kwargs) -> None:
+    def _render_internal_link(self, pdf_canvas: canvas.Canvas, widget: Widget, enforcer=None,
+                              page_num: int = 1, total_pages: int = 1) -> None:
         """Render text link to a named destination (properties.to_dest)."""
         if not widget.content:
             return
@@ -72,20 +103,19 @@ class LinkRenderer(BaseWidgetRenderer):
 
         styling = getattr(widget, 'styling', {}) or {}
 
-        # Process tokens in widget content
+        # Process tokens in widget content (plain labels have nothing to replace)
         content_text = widget.content
-        try:
-            page_num = kwargs.get('page_num', 1)
-            total_pages = kwargs.get('total_pages', 1)
-            render_context = RenderingTokenContext(
-                page_num=page_num,
-                total_pages=total_pages
-            )
-            content_text = TokenProcessor.replace_rendering_tokens(content_text, render_context)
-        except Exception as e:
-            if self.strict_mode:
-                raise RenderingError(f"internal_link '{widget.id}': token processing failed: {e}") from e
-            logger.warning(f"Token processing failed for internal_link {widget.id}: {e}")
+        if not isinstance(content_text, str) or '{' in content_text:
+            try:
+                render_context = RenderingTokenContext(
+                    page_num=page_num,
+                    total_pages=total_pages
+                )
+                content_text = TokenProcessor.replace_rendering_tokens(content_text, render_context)
+            except Exception as e:
+                if self.strict_mode:
+                    raise RenderingError(f"internal_link '{widget.id}': token processing failed: {e}") from e
+                logger.warning(f"Token processing failed for internal_link {widget.id}: {e}")
 
         # Apply constraints using centralized approach
         constrained_styling = self._apply_styling_constraints(styling, enforcer)
@@ -156,7 +186,7 @@ class LinkRenderer(BaseWidgetRenderer):
                 try:
                     target_page = int(target_page)
                     if 1 <= target_page <= total_pages:
-                        destination = f"Page_{target_page}"
+                        destination = self._page_destination(target_page, total_pages)
                         # logger.info(f"Tap zone page_link: widget={widget.id}, target_page={target_page}, → destination='{destination}'")
                     else:
                         logger.warning(f"Tap zone page_link: widget={widget.id}, target_page={target_page} out of range (1-{total_pages}), skipping link")
@@ -166,7 +196,7 @@ class LinkRenderer(BaseWidgetRenderer):
             elif action == 'next_page':
                 next_page = page_num + 1
                 if next_page <= total_pages:
-                    destination = f"Page_{next_page}"
+                    destination = self._page_destination(next_page, total_pages)
                     # logger.info(f"Tap zone next_page: widget={widget.id}, current_page={page_num}, → destination='{destination}'")
                 else:
                     # Don't create link beyond last page - just log and skip
@@ -175,7 +205,7 @@ class LinkRenderer(BaseWidgetRenderer):
             elif action == 'prev_page':
                 prev_page = max(1, page_num - 1)
                 if prev_page < page_num:  # Only create link if there's actually a previous page
-                    destination = f"Page_{prev_page}"
+                    destination = self._page_destination(prev_page, total_pages)
                     # logger.info(f"Tap zone prev_page: widget={widget.id}, current_page={page_num}, → destination='{destination}'")
                 else:
                     # Don't create link from page 1 to page 1 - just log and skip
@@ -188,6 +218,12 @@ class LinkRenderer(BaseWidgetRenderer):
         if destination:
             self._create_pdf_link_annotation(pdf_canvas, link_rect, destination, invisible=True)
 
+    def _page_destination(self, page: int, total_pages: int) -> Optional[str]:
+        """Bookmark name of a page, or None when it is outside 1..total_pages."""
+        if len(self._page_dests) != total_pages + 1:
+            self._page_dests = ['', *(f"Page_{i}" for i in range(1, total_pages + 1))]
+        return self._page_dests[page] if 1 <= page <= total_pages else None
+
     def _render_link_background(self, pdf_canvas: canvas.Canvas, box: Dict[str, float], props: Dict[str, Any]) -> None:
         """Render background/highlight for link with minimal state management."""
         try:
@@ -215,7 +251,7 @@ class LinkRenderer(BaseWidgetRenderer):
     def _create_pdf_link_annotation(self, pdf_canvas: canvas.Canvas, rect, destination: str, invisible: bool = False) -> None:
         """Create PDF link annotation with proper error handling."""
         try:
-            destination = self._normalize_destination(destination)
+            # Callers pass destinations already normalized
             if isinstance(rect, dict):
                 # Convert dict format to tuple
                 link_rect = (rect['x'], rect['y'], rect['x'] + rect['width'], rect['y'] + rect['height'])
@@ -241,14 +277,7 @@ class LinkRenderer(BaseWidgetRenderer):
         """Normalize page destinations to match bookmark naming."""
         if not isinstance(destination, str):
             return destination
-
-        lower = destination.lower()
-        if lower.startswith('page_'):
-            suffix = destination.split('_', 1)[1]
-            if suffix.isdigit():
-                return f"Page_{suffix}"
-
-        return destination
+        return _normalize_page_destination(destination)
 
         try:
             min_w, min_h = enforcer.check_touch_target_size(widget.position.width, widget.position.height)
@@ -295,19 +324,13 @@ class LinkRenderer(BaseWidgetRenderer):
 
         return constrained_styling
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple:
+    @staticmethod
+    def _hex_to_rgb(hex_color: str) -> tuple:
         """Convert hex color to RGB tuple (0-1 range for PDF)."""
-        try:
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) == 6:
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                return (r, g, b)
-            else:
-                return (0.0, 0.4, 0.8)  # Default blue
-        except Exception:
-            return (0.0, 0.4, 0.8)  # Default blue
+        if not isinstance(hex_color, str):
+            return _DEFAULT_LINK_RGB
+        # '#DBEAFE' and '#dbeafe' share a cache entry
+        return _parse_hex_rgb(hex_color.lstrip('#').lower())
 
     def validate_link_properties(self, widget: Widget) -> None:
         """
@@ -6,7 +6,7 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Tuple
 from reportlab.pdfgen import canvas
 
 from ..schema import Widget
@@ -25,7 +25,8 @@ class WidgetRendererRegistry:
 
     def __init__(self):
         """Initialize empty registry."""
-        self._renderers: Dict[str, BaseWidgetRenderer] = {}
+        # (widget_type, id(converter), strict_mode) -> renderer instance
+        self._renderers: Dict[Tuple[str, int, bool], BaseWidgetRenderer] = {}
         self._renderer_classes: Dict[str, Type[BaseWidgetRenderer]] = {}
         self.widget_errors: list[tuple[str, str, str]] = []  # (widget_id, widget_type, error_msg)
 
@@ -65,9 +66,10 @@ class WidgetRendererRegistry:
             RenderingError: If no renderer registered for widget type
         """
         # Check if we have a cached instance
-        cache_key = f"{widget_type}_{id(converter)}_{strict_mode}"
-        if cache_key in self._renderers:
-            return self._renderers[cache_key]
+        cache_key = (widget_type, id(converter), strict_mode)
+        renderer = self._renderers.get(cache_key)
+        if renderer is not None:
+            return renderer
 
         # Get renderer class
         renderer_class = self._renderer_classes.get(widget_type)
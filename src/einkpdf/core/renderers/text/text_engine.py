@@ -7,7 +7,8 @@ Follows CLAUDE.md coding standards - no dummy implementations.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
@@ -215,18 +216,7 @@ class TextEngine:
             pdf_canvas.setFont(font_name, options.font_size)
             pdf_canvas.setFillColor(HexColor(options.color))
 
-            # Calculate text position based on alignment
-            if options.text_align == 'center':
-                start_x = box['x'] + max(0.0, (box['width'] - text_width) / 2.0)
-            elif options.text_align == 'right':
-                start_x = box['x'] + max(0.0, box['width'] - text_width)
-            else:  # left alignment
-                start_x = box['x']
-
-            # Use provided horiz_y or calculate center position
-            text_y = options.horiz_y if options.horiz_y > 0 else (
-                box['y'] + (box['height'] - options.font_size) / 2.0
-            )
+            start_x, text_y = self._horizontal_origin(box, text_width, options)
 
             # Draw text
             pdf_canvas.drawString(start_x, text_y, text)
@@ -241,6 +231,44 @@ class TextEngine:
         finally:
             pdf_canvas.restoreState()
 
+    @staticmethod
+    def _horizontal_origin(box: Dict[str, float], text_width: float,
+                           options: TextRenderingOptions) -> Tuple[float, float]:
+        """Start point of horizontal text in its box."""
+        # Calculate text position based on alignment
+        if options.text_align == 'center':
+            start_x = box['x'] + max(0.0, (box['width'] - text_width) / 2.0)
+        elif options.text_align == 'right':
+            start_x = box['x'] + max(0.0, box['width'] - text_width)
+        else:  # left alignment
+            start_x = box['x']
+
+        # Use provided horiz_y or calculate center position
+        text_y = options.horiz_y if options.horiz_y > 0 else (
+            box['y'] + (box['height'] - options.font_size) / 2.0
+        )
+        return start_x, text_y
+
+    @contextmanager
+    def horizontal_batch(self, pdf_canvas: canvas.Canvas) -> Iterator['HorizontalTextBatch']:
+        """
+        Draw many short horizontal strings under a single saveState/restoreState.
+
+        Other drawing may be interleaved with the batch's draw() calls; the
+        font and fill colour it sets are restored when the block exits.
+
+        Args:
+            pdf_canvas: ReportLab canvas to draw on
+
+        Yields:
+            HorizontalTextBatch drawing onto pdf_canvas
+        """
+        pdf_canvas.saveState()
+        try:
+            yield HorizontalTextBatch(self, pdf_canvas)
+        finally:
+            pdf_canvas.restoreState()
+
     def calculate_text_dimensions(self, pdf_canvas: canvas.Canvas, text: str,
                                  font_name: str, font_size: float) -> Dict[str, float]:
         """
@@ -323,4 +351,52 @@ class TextEngine:
             text_align=text_align,
             orientation=orientation,
             underline=underline
-        )
\ No newline at end of file
+        )
+
+
+class HorizontalTextBatch:
+    """
+    Draws horizontal strings for TextEngine.horizontal_batch().
+
+    Digit strings that fit their box are drawn directly: digits stay within the
+    font size, so the clip render_text() would set is a no-op and its per-call
+    saveState/clip/restoreState is skipped. Font and fill are only re-issued
+    when they change. Anything else goes through TextEngine.render_text().
+    """
+
+    __slots__ = ('text_engine', 'pdf_canvas', 'font', 'color')
+
+    def __init__(self, text_engine: TextEngine, pdf_canvas: canvas.Canvas):
+        self.text_engine = text_engine
+        self.pdf_canvas = pdf_canvas
+        self.font = None
+        self.color = None
+
+    def draw(self, box: Dict[str, float], text: str, options: TextRenderingOptions) -> None:
+        """Draw text in box, like TextEngine.render_text()."""
+        pdf_canvas = self.pdf_canvas
+        if (not text.isdigit() or options.underline or options.orientation != 'horizontal'
+                or options.font_size > box['height']):
+            self.text_engine.render_text(pdf_canvas, box, text, options)
+            return
+        try:
+            font_name = ensure_font_registered(options.font_name)
+            text_width = pdf_canvas.stringWidth(text, font_name, options.font_size)
+            fill = HexColor(options.color) if options.color != self.color else None
+        except Exception:
+            self.text_engine.render_text(pdf_canvas, box, text, options)
+            return
+        if text_width > box['width']:
+            self.text_engine.render_text(pdf_canvas, box, text, options)
+            return
+
+        font = (font_name, options.font_size)
+        if font != self.font:
+            pdf_canvas.setFont(font_name, options.font_size)
+            self.font = font
+        if fill is not None:
+            pdf_canvas.setFillColor(fill)
+            self.color = options.color
+
+        start_x, text_y = self.text_engine._horizontal_origin(box, text_width, options)
+        pdf_canvas.drawString(start_x, text_y, text)